@@ -8,6 +8,13 @@ from .loader import (
 )
 from .mapper import map_finding_to_tables
 from .mitigations import generate_mitigation_checklist
+from .radar import (
+    AgentEdge,
+    AgentGraph,
+    AgentNode,
+    RepositoryScanner,
+    scan_repository,
+)
 from .models import (
     MappingTable,
     RadarFinding,
@@ -16,14 +23,19 @@ from .models import (
 )
 
 __all__ = [
+    "AgentEdge",
+    "AgentGraph",
+    "AgentNode",
     "FindingMapping",
     "MappingTable",
     "MitigationChecklistEntry",
     "RadarFinding",
+    "RepositoryScanner",
     "generate_mitigation_checklist",
     "get_agentic_ai_mapping",
     "get_llm_top10_mapping",
     "list_agentic_ai_versions",
     "list_llm_top10_versions",
     "map_finding_to_tables",
+    "scan_repository",
 ]
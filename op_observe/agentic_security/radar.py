@@ -0,0 +1,878 @@
+"""Agentic radar scanner that extracts workflow graphs from source trees.
+
+The scanner walks a repository and builds an :class:`AgentGraph` describing
+agent nodes, tools, workflow edges and MCP servers.  Python sources are
+analysed through :mod:`ast`, while JSON/YAML configuration files and n8n
+workflow exports are parsed structurally.  The resulting graph feeds the
+OWASP mapping layer (:mod:`op_observe.agentic_security.mapper`) and the HTML
+security report.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+try:  # pragma: no cover - exercised only when PyYAML is installed
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None  # type: ignore[assignment]
+    _YamlLoader = None
+else:
+    try:
+        # libyaml-backed loader; an order of magnitude faster than the
+        # pure-Python SafeLoader on YAML-heavy configuration trees.
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:  # pragma: no cover - libyaml not compiled in
+        from yaml import SafeLoader as _YamlLoader
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+
+_SCANNED_SUFFIXES = {".py", ".json", ".yaml", ".yml"}
+
+_IGNORED_DIRS = {
+    ".git",
+    ".op-observe-cache",
+    "__pycache__",
+    "node_modules",
+    "venv",
+    ".venv",
+}
+
+_MCP_SERVER_PATTERN = re.compile(
+    r"(?:mcp[\w.+-]*://[\w.:/@-]+|modelcontextprotocol[\w./-]*|mcp[_-]server[\w-]*)",
+    re.IGNORECASE,
+)
+
+_TOOL_DECORATOR_NAMES = frozenset({"tool", "structured_tool"})
+_TOOL_DECORATOR_TAILS = tuple(f".{name}" for name in sorted(_TOOL_DECORATOR_NAMES))
+
+_RETRIEVER_TOOLS = frozenset({"retrieval", "file_search", "vector_store"})
+
+_LANGGRAPH_BUILDER_SUFFIXES = ("stategraph", "messagegraph")
+_OPENAI_SUFFIXES = ("agents.create", "assistants.create")
+_LANGCHAIN_AGENT_SUFFIXES = ("initialize_agent", "create_react_agent")
+
+# Fixed-vocabulary strings are interned so repeated node/edge metadata shares
+# one object per value: dict-key equality degrades to a pointer compare and
+# large scans stop duplicating the same few strings thousands of times.
+_FW_LANGCHAIN = sys.intern("langchain")
+_FW_LANGGRAPH = sys.intern("langgraph")
+_FW_N8N = sys.intern("n8n")
+_FW_OPENAI = sys.intern("openai")
+
+_KIND_AGENT = sys.intern("agent")
+_KIND_FLOW = sys.intern("flow")
+_KIND_RETRIEVER = sys.intern("retriever")
+_KIND_STEP = sys.intern("step")
+_KIND_TOOL = sys.intern("tool")
+_KIND_TRIGGER = sys.intern("trigger")
+_KIND_USES = sys.intern("uses")
+_KIND_WORKFLOW = sys.intern("workflow")
+
+# Sentinel distinguishing "not cached" from a cached None.
+_MISSING = object()
+
+
+# Metadata values the scanner itself produces; everything else falls back to
+# repr().  Exact type() checks beat isinstance here because the hierarchy is
+# flat and this runs once per add_node on large graphs.
+_SCALAR = (str, int, float, bool)
+
+
+@dataclass
+class AgentNode:
+    """A node in the extracted agentic workflow graph."""
+
+    id: str
+    kind: str
+    metadata: Dict[str, object] = field(default_factory=dict)
+    # Tracks whether metadata mutated since the last key-sort in as_dict().
+    _dirty: bool = field(default=True, repr=False, compare=False)
+    # Identity of the last metadata mapping merged in; callers reuse one
+    # mapping per file, so a repeat merge of the same object is a no-op.
+    _last_meta: Optional[Mapping[str, object]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def update(self, kind: Optional[str] = None, metadata: Optional[Mapping[str, object]] = None) -> None:
+        """Merge *kind* and *metadata* into the node in place."""
+
+        if kind and self.kind == "unknown":
+            self.kind = kind
+        if metadata and metadata is not self._last_meta:
+            own = self.metadata
+            for key, value in metadata.items():
+                if value is None:
+                    continue
+                own[key] = value if type(value) in _SCALAR else repr(value)
+            self._last_meta = metadata
+            self._dirty = True
+
+
+# Internal edge representation: (source, target, kind, metadata items).
+_EdgeTuple = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class AgentEdge:
+    """A directed edge between two workflow nodes.
+
+    Edges are stored internally as plain tuples (see ``AgentGraph.edges``);
+    this dataclass remains as the public representation returned by
+    :meth:`AgentGraph.iter_edges`.
+    """
+
+    source: str
+    target: str
+    kind: str
+    metadata: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def create(
+        cls,
+        source: str,
+        target: str,
+        kind: str,
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> "AgentEdge":
+        items: Tuple[Tuple[str, str], ...] = ()
+        if metadata:
+            items = tuple(sorted((key, str(value)) for key, value in metadata.items()))
+        return cls(source=source, target=target, kind=kind, metadata=items)
+
+
+class AgentGraph:
+    """Mutable container accumulating scan results for a repository."""
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, AgentNode] = {}
+        self.edges: Set[_EdgeTuple] = set()
+        self.mcp_servers: Dict[str, Dict[str, object]] = {}
+
+    def add_node(
+        self,
+        node_id: str,
+        kind: str = "unknown",
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> AgentNode:
+        node = self.nodes.get(node_id)
+        if node is None:
+            node = AgentNode(id=node_id, kind=kind)
+            self.nodes[node_id] = node
+            if metadata:
+                node.update(metadata=metadata)
+        else:
+            node.update(kind=kind, metadata=metadata)
+        return node
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        kind: str = "flow",
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        self.add_node(source)
+        self.add_node(target)
+        meta: Tuple[Tuple[str, str], ...] = ()
+        if metadata:
+            meta = tuple(sorted((key, str(value)) for key, value in metadata.items()))
+        self.edges.add((source, target, kind, meta))
+
+    def add_mcp_server(self, name: str, metadata: Optional[Mapping[str, object]] = None) -> None:
+        entry = self.mcp_servers.setdefault(name, {})
+        if metadata:
+            entry.update(metadata)
+
+    def merge(self, other: "AgentGraph") -> None:
+        """Fold the contents of *other* (a per-file partial graph) into self."""
+
+        for node in other.nodes.values():
+            self.add_node(node.id, node.kind, node.metadata)
+        self.edges |= other.edges
+        for name, metadata in other.mcp_servers.items():
+            self.add_mcp_server(name, metadata)
+
+    def as_dict(self) -> Dict[str, object]:
+        """Serialise the graph deterministically for reports and evidence.
+
+        Node metadata dictionaries are key-sorted in place the first time a
+        node is serialised after mutation (insertion order is preserved from
+        then on), so repeated exports skip the per-node sort.
+        """
+
+        nodes = []
+        for node in sorted(self.nodes.values(), key=lambda node: node.id):
+            if node._dirty:
+                node.metadata = dict(sorted(node.metadata.items()))
+                node._dirty = False
+            nodes.append(
+                {"id": node.id, "kind": node.kind, "metadata": node.metadata}
+            )
+        edges = [
+            {
+                "source": source,
+                "target": target,
+                "kind": kind,
+                "metadata": dict(meta),
+            }
+            for source, target, kind, meta in sorted(self.edges)
+        ]
+        mcp_servers = [
+            {"name": name, "metadata": dict(sorted(metadata.items()))}
+            for name, metadata in sorted(self.mcp_servers.items())
+        ]
+        return {"nodes": nodes, "edges": edges, "mcp_servers": mcp_servers}
+
+    def iter_edges(self) -> Tuple[AgentEdge, ...]:
+        """Materialise the public :class:`AgentEdge` view of the edge set."""
+
+        return tuple(
+            AgentEdge(source=source, target=target, kind=kind, metadata=meta)
+            for source, target, kind, meta in sorted(self.edges)
+        )
+
+
+class _FileCache:
+    """On-disk cache of per-file partial graphs for incremental scans.
+
+    Entries are keyed by ``(absolute path, st_mtime_ns, st_size)`` so any
+    modification invalidates the cached result.  The cache lives under
+    ``.op-observe-cache/`` inside the scanned root and is only consulted when
+    ``OP_OBSERVE_CACHE=1`` is set, keeping one-shot scans free of cache IO.
+
+    The scanned tree is untrusted input — a hostile repository could plant
+    the cache file — so the payload is plain JSON; loading it must never be
+    able to execute code.
+    """
+
+    _FILENAME = "radar-cache.json"
+    # Bumped whenever the on-disk graph layout changes (e.g. the edge
+    # representation); mismatching caches are discarded wholesale.
+    _FORMAT = 3
+
+    def __init__(self, root: Path) -> None:
+        self._path = root / ".op-observe-cache" / self._FILENAME
+        self._entries: Dict[Tuple[str, int, int], AgentGraph] = {}
+        self._dirty = False
+        try:
+            with self._path.open("rb") as handle:
+                payload = _json_loads(handle.read())
+        except (OSError, ValueError):
+            payload = None
+        if isinstance(payload, dict) and payload.get("format") == self._FORMAT:
+            try:
+                self._entries = {
+                    (path, mtime_ns, size): self._decode_graph(graph)
+                    for path, mtime_ns, size, graph in payload["entries"]
+                }
+            except (KeyError, TypeError, ValueError):
+                # Truncated or hand-edited cache; start from scratch.
+                self._entries = {}
+
+    @staticmethod
+    def _encode_graph(partial: AgentGraph) -> Dict[str, object]:
+        return {
+            "nodes": [
+                [node.id, node.kind, node.metadata]
+                for node in partial.nodes.values()
+            ],
+            "edges": sorted(partial.edges),
+            "mcp_servers": partial.mcp_servers,
+        }
+
+    @staticmethod
+    def _decode_graph(payload: Mapping[str, object]) -> AgentGraph:
+        graph = AgentGraph()
+        for node_id, kind, metadata in payload["nodes"]:  # type: ignore[union-attr]
+            graph.add_node(node_id, kind, metadata)
+        for source, target, kind, meta in payload["edges"]:  # type: ignore[union-attr]
+            graph.edges.add(
+                (source, target, kind, tuple((key, value) for key, value in meta))
+            )
+        for name, metadata in payload["mcp_servers"].items():  # type: ignore[union-attr]
+            graph.add_mcp_server(name, metadata)
+        return graph
+
+    @staticmethod
+    def key_for(path: Path) -> Tuple[str, int, int]:
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[AgentGraph]:
+        return self._entries.get(key)
+
+    def put(self, key: Tuple[str, int, int], partial: AgentGraph) -> None:
+        # Drop stale entries for the same path before inserting the new one.
+        stale = [entry for entry in self._entries if entry[0] == key[0]]
+        for entry in stale:
+            del self._entries[entry]
+        self._entries[key] = partial
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": self._FORMAT,
+            "entries": [
+                [path, mtime_ns, size, self._encode_graph(partial)]
+                for (path, mtime_ns, size), partial in self._entries.items()
+            ],
+        }
+        with self._path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        self._dirty = False
+
+
+# Child fields per AST class, computed once at import time.  The worklist
+# traversal below consults this table instead of ast.iter_child_nodes, which
+# re-derives fields via getattr on every visit.
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {
+    node_type: node_type._fields
+    for node_type in vars(ast).values()
+    if isinstance(node_type, type) and issubclass(node_type, ast.AST)
+}
+
+
+class _PythonAgentAnalyzer:
+    """Extract agent constructs from a single Python module.
+
+    Traversal is an explicit breadth-first worklist with a per-type dispatch
+    table rather than :class:`ast.NodeVisitor`, avoiding the paired
+    ``visit``/``generic_visit`` Python call per node.  Handlers are pure
+    extraction leaves; they never recurse.
+    """
+
+    def __init__(self, path: Path, graph: AgentGraph) -> None:
+        self.path = path
+        self._path_str = sys.intern(str(path))
+        self.graph = graph
+        self._imports: Dict[str, str] = {}
+        self._has_mcp = False
+        # One metadata mapping per (file, framework); AgentNode.update skips
+        # the merge loop entirely when it sees the same object again.
+        self._meta_file = {"file": self._path_str}
+        self._meta_langchain = {"file": self._path_str, "framework": _FW_LANGCHAIN}
+        self._meta_langgraph = {"file": self._path_str, "framework": _FW_LANGGRAPH}
+        self._meta_openai = {"file": self._path_str, "framework": _FW_OPENAI}
+        # Memoised name resolutions keyed by id(node); valid for the lifetime
+        # of the tree being analysed (one analyzer per file).
+        self._name_cache: Dict[int, Optional[str]] = {}
+        self._base_name_cache: Dict[int, Optional[str]] = {}
+
+    def analyze(self) -> None:
+        # Read and decode exactly once; the byte-level prefilter lets files
+        # without any "mcp" substring skip the MCP pattern scan entirely.
+        data = self.path.read_bytes()
+        self._has_mcp = b"mcp" in data.lower()
+        source = data.decode("utf-8", "replace")
+        if self._has_mcp:
+            # One regex sweep over the whole source instead of a search per
+            # string constant during the AST walk.  Slightly broader (it also
+            # sees comments) but matches the substring semantics we want for
+            # MCP endpoint discovery.
+            for match in _MCP_SERVER_PATTERN.finditer(source):
+                self.graph.add_mcp_server(match.group(0), metadata=self._meta_file)
+        try:
+            tree = ast.parse(source, filename=str(self.path))
+        except SyntaxError:
+            return
+
+        stack: deque = deque([tree])
+        dispatch = self._DISPATCH
+        child_fields = _CHILD_FIELDS
+        empty: Tuple[str, ...] = ()
+        while stack:
+            node = stack.popleft()
+            node_type = type(node)
+            handler = dispatch.get(node_type)
+            if handler is not None:
+                handler(self, node)
+            for field_name in child_fields.get(node_type, empty):
+                value = getattr(node, field_name, None)
+                if type(value) is list:
+                    stack.extend(value)
+                elif isinstance(value, ast.AST):
+                    stack.append(value)
+
+    # Extraction handlers (leaves; traversal happens in analyze) ---------
+    def _handle_import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self._imports[alias.asname or alias.name] = alias.name
+
+    def _handle_import_from(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            self._imports[alias.asname or alias.name] = f"{module}.{alias.name}"
+
+    def _handle_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        for decorator in node.decorator_list:
+            if self._looks_like_tool_decorator(decorator):
+                self.graph.add_node(
+                    node.name,
+                    kind=_KIND_TOOL,
+                    metadata=self._meta_langchain,
+                )
+                break
+
+    def _handle_call(self, call: ast.Call) -> None:
+        call_name = self._call_name(call.func)
+        if not call_name:
+            return
+        # First-token prefilter: dispatch on the final dotted token so the
+        # common case (an uninteresting call) costs one dict probe instead of
+        # the full classification chain.  Only the fall-through paths need
+        # the resolved import symbol.
+        cn_lower = call_name.lower()
+        tail = cn_lower.rsplit(".", 1)[-1]
+        handler = self._CALL_TAIL_HANDLERS.get(tail)
+        if handler is not None:
+            handler(self, call, tail)
+            return
+
+        resolved_symbol = self._resolve_symbol(call_name)
+        resolved_lower = resolved_symbol.lower() if resolved_symbol else None
+
+        if tail == "create":
+            if self._is_openai_agent_call(cn_lower, resolved_lower):
+                self._extract_openai_agent(call)
+            return
+
+        if "toolnode" in cn_lower or (resolved_lower and "toolnode" in resolved_lower):
+            self._extract_tool_node(call, tail)
+            return
+
+        if self._is_langgraph_builder(cn_lower, resolved_lower):
+            self._extract_langgraph_builder(call, tail)
+
+    # Per-pattern extraction methods -------------------------------------
+    def _extract_langgraph_builder(self, call: ast.Call, tail: str) -> None:
+        workflow = self._first_str_argument(call) or "stategraph"
+        self.graph.add_node(
+            workflow,
+            kind=_KIND_WORKFLOW,
+            metadata=self._meta_langgraph,
+        )
+
+    def _extract_graph_edge(self, call: ast.Call, tail: str) -> None:
+        args = self._str_arguments(call)
+        if len(args) >= 2:
+            self.graph.add_edge(
+                args[0],
+                args[1],
+                kind=_KIND_FLOW,
+                metadata=self._meta_langgraph,
+            )
+
+    def _extract_graph_node(self, call: ast.Call, tail: str) -> None:
+        args = self._str_arguments(call)
+        if args:
+            self.graph.add_node(
+                args[0],
+                kind=_KIND_STEP,
+                metadata=self._meta_langgraph,
+            )
+
+    def _extract_openai_agent(self, call: ast.Call) -> None:
+        agent = self._keyword_str(call, "name") or "openai-agent"
+        self.graph.add_node(
+            agent,
+            kind=_KIND_AGENT,
+            metadata=self._meta_openai,
+        )
+        self._parse_openai_tools(call, agent)
+
+    def _extract_tool_node(self, call: ast.Call, tail: str) -> None:
+        self.graph.add_node(
+            self._first_str_argument(call) or "tool-node",
+            kind=_KIND_TOOL,
+            metadata=self._meta_langgraph,
+        )
+
+    def _extract_langchain_agent(self, call: ast.Call, tail: str) -> None:
+        self.graph.add_node(
+            self._keyword_str(call, "name") or tail,
+            kind=_KIND_AGENT,
+            metadata=self._meta_langchain,
+        )
+
+    def _parse_openai_tools(self, call: ast.Call, agent: str) -> None:
+        for keyword in call.keywords:
+            if keyword.arg != "tools" or not isinstance(keyword.value, (ast.List, ast.Tuple)):
+                continue
+            for element in keyword.value.elts:
+                tool_name = self._tool_name_from_spec(element)
+                if not tool_name:
+                    continue
+                kind = _KIND_RETRIEVER if tool_name in _RETRIEVER_TOOLS else _KIND_TOOL
+                self.graph.add_node(
+                    tool_name,
+                    kind=kind,
+                    metadata=self._meta_openai,
+                )
+                self.graph.add_edge(
+                    agent,
+                    tool_name,
+                    kind=_KIND_USES,
+                    metadata=self._meta_openai,
+                )
+
+    @staticmethod
+    def _tool_name_from_spec(element: ast.expr) -> Optional[str]:
+        if isinstance(element, ast.Constant) and isinstance(element.value, str):
+            return element.value
+        if isinstance(element, ast.Dict):
+            for key, value in zip(element.keys, element.values):
+                if (
+                    isinstance(key, ast.Constant)
+                    and key.value == "type"
+                    and isinstance(value, ast.Constant)
+                    and isinstance(value.value, str)
+                ):
+                    return value.value
+        return None
+
+    # Classification helpers --------------------------------------------
+    @staticmethod
+    def _is_langgraph_builder(cn_lower: str, resolved_lower: Optional[str]) -> bool:
+        if cn_lower.endswith(_LANGGRAPH_BUILDER_SUFFIXES):
+            return True
+        return bool(
+            resolved_lower
+            and resolved_lower.startswith("langgraph.")
+            and resolved_lower.endswith(_LANGGRAPH_BUILDER_SUFFIXES)
+        )
+
+    @staticmethod
+    def _is_openai_agent_call(cn_lower: str, resolved_lower: Optional[str]) -> bool:
+        if cn_lower.endswith(_OPENAI_SUFFIXES):
+            return True
+        return bool(resolved_lower and resolved_lower.endswith(_OPENAI_SUFFIXES))
+
+    def _looks_like_tool_decorator(self, decorator: ast.expr) -> bool:
+        name = self._call_name(decorator)
+        if not name:
+            return False
+        lowered = name.lower()
+        return lowered in _TOOL_DECORATOR_NAMES or lowered.endswith(
+            _TOOL_DECORATOR_TAILS
+        )
+
+    def _resolve_symbol(self, call_name: str) -> Optional[str]:
+        head, _, tail = call_name.partition(".")
+        resolved = self._imports.get(head)
+        if resolved is None:
+            return None
+        return f"{resolved}.{tail}" if tail else resolved
+
+    # AST helpers -------------------------------------------------------
+    def _call_name(self, expr: ast.expr) -> Optional[str]:
+        cache = self._name_cache
+        key = id(expr)
+        cached = cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        name: Optional[str]
+        if isinstance(expr, ast.Name):
+            name = expr.id
+        elif isinstance(expr, ast.Attribute):
+            base = self._call_name(expr.value)
+            name = None if base is None else f"{base}.{expr.attr}"
+        elif isinstance(expr, ast.Call):
+            name = self._call_name(expr.func)
+        else:
+            name = None
+        cache[key] = name
+        return name
+
+    def _attribute_base_name(self, expr: ast.expr) -> Optional[str]:
+        cache = self._base_name_cache
+        key = id(expr)
+        cached = cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        node = expr
+        while isinstance(node, ast.Attribute):
+            node = node.value
+        name = node.id if isinstance(node, ast.Name) else None
+        cache[key] = name
+        return name
+
+    @staticmethod
+    def _str_arguments(call: ast.Call) -> Tuple[str, ...]:
+        return tuple(
+            arg.value
+            for arg in call.args
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+        )
+
+    @staticmethod
+    def _first_str_argument(call: ast.Call) -> Optional[str]:
+        # Early-exit scan; avoids materialising the full argument tuple that
+        # _str_arguments would build when only the first value is needed.
+        for arg in call.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                return arg.value
+        return None
+
+    @staticmethod
+    def _keyword_str(call: ast.Call, name: str) -> Optional[str]:
+        for keyword in call.keywords:
+            if (
+                keyword.arg == name
+                and isinstance(keyword.value, ast.Constant)
+                and isinstance(keyword.value.value, str)
+            ):
+                return keyword.value.value
+        return None
+
+    # Handler specs map keys to method names; _compile_dispatch resolves them
+    # to concrete functions once per class (and again per subclass), so
+    # overriding a handler in a subclass transparently rebuilds the tables.
+    _DISPATCH_SPEC: Dict[type, str] = {
+        ast.Import: "_handle_import",
+        ast.ImportFrom: "_handle_import_from",
+        ast.FunctionDef: "_handle_function",
+        ast.AsyncFunctionDef: "_handle_function",
+        ast.Call: "_handle_call",
+    }
+
+    # Call-name tail tokens with an unambiguous extraction; anything not in
+    # this table goes through the slower resolved-symbol fall-through.
+    _CALL_TAIL_SPEC: Dict[str, str] = {
+        "stategraph": "_extract_langgraph_builder",
+        "messagegraph": "_extract_langgraph_builder",
+        "add_edge": "_extract_graph_edge",
+        "add_node": "_extract_graph_node",
+        "toolnode": "_extract_tool_node",
+        "initialize_agent": "_extract_langchain_agent",
+        "create_react_agent": "_extract_langchain_agent",
+    }
+
+    _DISPATCH: Dict[type, "Callable[[_PythonAgentAnalyzer, ast.AST], None]"] = {}
+    _CALL_TAIL_HANDLERS: Dict[
+        str, "Callable[[_PythonAgentAnalyzer, ast.Call, str], None]"
+    ] = {}
+
+    @classmethod
+    def _compile_dispatch(cls) -> None:
+        cls._DISPATCH = {
+            node_type: getattr(cls, name)
+            for node_type, name in cls._DISPATCH_SPEC.items()
+        }
+        cls._CALL_TAIL_HANDLERS = {
+            tail: getattr(cls, name) for tail, name in cls._CALL_TAIL_SPEC.items()
+        }
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_dispatch()
+
+
+_PythonAgentAnalyzer._compile_dispatch()
+
+
+def _parse_config_file(path: Path, graph: AgentGraph, text: Optional[str] = None) -> None:
+    """Extract agents, tools and MCP servers from a JSON/YAML config file."""
+
+    if text is None:
+        text = path.read_bytes().decode("utf-8", "replace")
+    payload: object
+    try:
+        payload = _json_loads(text)
+    except ValueError:
+        if yaml is None:
+            payload = None
+        else:
+            try:
+                payload = yaml.load(text, Loader=_YamlLoader)
+            except yaml.YAMLError:
+                payload = None
+
+    meta = {"file": sys.intern(str(path))}
+    if isinstance(payload, Mapping):
+        _extract_config_entries(payload, graph, meta)
+
+    if "mcp" in text.lower():
+        for match in _MCP_SERVER_PATTERN.finditer(text):
+            graph.add_mcp_server(match.group(0), metadata=meta)
+
+
+def _extract_config_entries(
+    payload: Mapping, graph: AgentGraph, meta: Mapping[str, object]
+) -> None:
+    for key in ("agents", "tools"):
+        entries = payload.get(key)
+        if not isinstance(entries, (list, tuple)):
+            continue
+        kind = "agent" if key == "agents" else "tool"
+        for entry in entries:
+            name = entry.get("name") if isinstance(entry, Mapping) else entry
+            if isinstance(name, str) and name:
+                graph.add_node(name, kind=kind, metadata=meta)
+
+    for key in ("mcp_servers", "mcpServers"):
+        servers = payload.get(key)
+        if isinstance(servers, Mapping):
+            for name in servers:
+                graph.add_mcp_server(str(name), metadata=meta)
+        elif isinstance(servers, (list, tuple)):
+            for entry in servers:
+                name = entry.get("name") if isinstance(entry, Mapping) else entry
+                if isinstance(name, str) and name:
+                    graph.add_mcp_server(name, metadata=meta)
+
+
+def _parse_n8n_workflow(path: Path, graph: AgentGraph, text: Optional[str] = None) -> bool:
+    """Parse an n8n workflow export.  Returns ``False`` if *path* is not one."""
+
+    if text is None:
+        text = path.read_bytes().decode("utf-8", "replace")
+    try:
+        payload = _json_loads(text)
+    except ValueError:
+        return False
+    if not isinstance(payload, Mapping):
+        return False
+    nodes = payload.get("nodes")
+    connections = payload.get("connections")
+    if not isinstance(nodes, list) or not isinstance(connections, Mapping):
+        return False
+
+    meta = {"file": sys.intern(str(path)), "framework": _FW_N8N}
+    for node in nodes:
+        if not isinstance(node, Mapping):
+            continue
+        name = node.get("name")
+        if not isinstance(name, str):
+            continue
+        graph.add_node(
+            name,
+            kind=_classify_n8n_node(str(node.get("type", ""))),
+            metadata=meta,
+        )
+
+    for source, outputs in connections.items():
+        if not isinstance(outputs, Mapping):
+            continue
+        for branches in outputs.values():
+            if not isinstance(branches, list):
+                continue
+            for branch in branches:
+                if not isinstance(branch, list):
+                    continue
+                for connection in branch:
+                    target = (
+                        connection.get("node")
+                        if isinstance(connection, Mapping)
+                        else None
+                    )
+                    if isinstance(target, str):
+                        graph.add_edge(
+                            str(source),
+                            target,
+                            kind=_KIND_FLOW,
+                            metadata=meta,
+                        )
+    return True
+
+
+def _classify_n8n_node(node_type: str) -> str:
+    lowered = node_type.lower()
+    if "agent" in lowered:
+        return "agent"
+    if "tool" in lowered:
+        return "tool"
+    if "trigger" in lowered or "webhook" in lowered:
+        return "trigger"
+    return "step"
+
+
+def _iter_scan_paths(root: Path) -> Iterator[Path]:
+    """Yield scannable files via :func:`os.scandir`, sorted per directory.
+
+    Sorting each directory listing (instead of materialising and sorting the
+    whole tree as ``sorted(root.rglob("*"))`` did) keeps peak memory bounded
+    by the largest directory while :meth:`AgentGraph.as_dict` still guarantees
+    deterministic output.  Ignored directories are pruned without descending.
+    """
+
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in children:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _IGNORED_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                path = Path(entry.path)
+                if path.suffix in _SCANNED_SUFFIXES:
+                    yield path
+
+
+class RepositoryScanner:
+    """Walk a repository root and accumulate an :class:`AgentGraph`."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    def scan(self) -> AgentGraph:
+        graph = AgentGraph()
+        cache: Optional[_FileCache] = None
+        if os.environ.get("OP_OBSERVE_CACHE") == "1":
+            cache = _FileCache(self.root)
+
+        for path in _iter_scan_paths(self.root):
+            if cache is None:
+                self._parse_file(path, graph)
+                continue
+            key = _FileCache.key_for(path)
+            cached = cache.get(key)
+            if cached is not None:
+                graph.merge(cached)
+                continue
+            partial = AgentGraph()
+            self._parse_file(path, partial)
+            cache.put(key, partial)
+            graph.merge(partial)
+
+        if cache is not None:
+            cache.save()
+        return graph
+
+    def _parse_file(self, path: Path, graph: AgentGraph) -> None:
+        if path.suffix == ".py":
+            _PythonAgentAnalyzer(path, graph).analyze()
+        elif path.suffix == ".json":
+            text = path.read_bytes().decode("utf-8", "replace")
+            if not _parse_n8n_workflow(path, graph, text):
+                _parse_config_file(path, graph, text)
+        else:
+            _parse_config_file(path, graph)
+
+
+def scan_repository(root: Path | str) -> AgentGraph:
+    """Convenience wrapper building a :class:`RepositoryScanner` and scanning."""
+
+    return RepositoryScanner(root).scan()
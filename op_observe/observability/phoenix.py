@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Protocol
+from typing import Any, Dict, Iterable, Mapping, MutableMapping, Protocol, Sequence
 from urllib import request
 
 from .tracing import (
@@ -118,18 +118,25 @@ class PhoenixTraceExporter:
     def export(
         self,
         trace_id: str,
-        spans: Iterable[OpenInferenceSpan],
-        evaluations: Iterable[OpenInferenceEvaluation],
+        spans: Sequence[OpenInferenceSpan | Mapping[str, Any]],
+        evaluations: Sequence[OpenInferenceEvaluation],
     ) -> MutableMapping[str, TransportResponse]:
-        """Send a set of spans + evaluations to Phoenix and refresh dashboards."""
+        """Send a set of spans + evaluations to Phoenix and refresh dashboards.
+
+        ``spans`` may be :class:`OpenInferenceSpan` instances or pre-built
+        wire mappings; the latter are forwarded as-is so sessions that
+        snapshot spans at end time pay no extra serialisation here.
+        """
 
         span_payload = PhoenixTracePayload(
             trace_id=trace_id,
-            spans=[span.to_wire() for span in spans],
+            spans=[
+                span if isinstance(span, Mapping) else span.to_wire()
+                for span in spans
+            ],
         )
         responses: Dict[str, TransportResponse] = {}
         responses["traces"] = self._client.upload_trace(span_payload)
-        evaluations = list(evaluations)
         if evaluations:
             responses["evaluations"] = self._client.upload_evaluations(
                 trace_id,
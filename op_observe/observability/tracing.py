@@ -2,17 +2,75 @@
 
 from __future__ import annotations
 
+import os
+import threading
 import time
-import uuid
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, MutableMapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+)
 
 if TYPE_CHECKING:
     from .phoenix import PhoenixTraceExporter, TransportResponse
 
 
+# ID generation --------------------------------------------------------
+#
+# os.urandom is a syscall on most platforms; spans need two IDs each, so
+# the syscall is amortised by slicing from a pooled buffer refilled in
+# 4 KiB chunks (roughly 256 span IDs per refill).
+
+_RAND_LOCK = threading.Lock()
+_RAND_POOL = b""
+_RAND_OFFSET = 0
+_RAND_REFILL = 4096
+
+
+def _take_random(size: int) -> bytes:
+    global _RAND_POOL, _RAND_OFFSET
+    with _RAND_LOCK:
+        offset = _RAND_OFFSET
+        if offset + size > len(_RAND_POOL):
+            _RAND_POOL = os.urandom(_RAND_REFILL)
+            offset = 0
+        _RAND_OFFSET = offset + size
+        return _RAND_POOL[offset : offset + size]
+
+
+def _reset_rand_pool() -> None:
+    """Discard the pooled bytes; the next draw refills from os.urandom."""
+
+    global _RAND_POOL, _RAND_OFFSET
+    _RAND_POOL = b""
+    _RAND_OFFSET = 0
+
+
+# The pool is copied by fork; without a reset, parent and child would
+# emit identical trace and span IDs until their copies drain (prefork
+# servers like gunicorn make this the common deployment shape).
+if hasattr(os, "register_at_fork"):  # pragma: no branch - POSIX only
+    os.register_at_fork(after_in_child=_reset_rand_pool)
+
+
+def _generate_trace_id() -> str:
+    return _take_random(16).hex()
+
+
+def _generate_span_id() -> str:
+    return _take_random(8).hex()
+
+
 class OpenInferenceSpanKind(str, Enum):
     """Semantic span categories supported by OpenInference."""
 
@@ -38,12 +96,14 @@ class OpenInferenceSpan:
 
     name: str
     kind: OpenInferenceSpanKind
-    start_time: float
-    end_time: float
+    # Integer epoch nanoseconds with the default clock; sessions constructed
+    # with a custom clock keep whatever numeric type that clock returns.
+    start_time: float | int
+    end_time: float | int
     attributes: MutableMapping[str, Any] = field(default_factory=dict)
-    span_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    span_id: str = field(default_factory=_generate_span_id)
     parent_id: str | None = None
-    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    trace_id: str = field(default_factory=_generate_trace_id)
 
     def to_wire(self) -> Dict[str, Any]:
         """Serialise span data into the structure expected by Phoenix."""
@@ -92,6 +152,20 @@ class PhoenixTracePayload:
     spans: List[Mapping[str, Any]]
 
 
+_EXPORTER_CLS: type | None = None
+
+
+def _exporter_cls() -> type:
+    # Resolved lazily to dodge the circular import with .phoenix, then
+    # memoised so session construction skips the sys.modules round trip.
+    global _EXPORTER_CLS
+    if _EXPORTER_CLS is None:
+        from .phoenix import PhoenixTraceExporter
+
+        _EXPORTER_CLS = PhoenixTraceExporter
+    return _EXPORTER_CLS
+
+
 class PhoenixTraceSession:
     """High-level helper to build and submit traces to Phoenix."""
 
@@ -100,17 +174,24 @@ class PhoenixTraceSession:
         exporter: "PhoenixTraceExporter",
         *,
         trace_id: str | None = None,
-        clock: Callable[[], float] | None = None,
+        clock: Callable[[], float | int] | None = None,
+        capacity: int | None = None,
     ) -> None:
-        from .phoenix import PhoenixTraceExporter  # circular import guard
-
-        if not isinstance(exporter, PhoenixTraceExporter):  # pragma: no cover - defensive
+        if not isinstance(exporter, _exporter_cls()):  # pragma: no cover - defensive
             raise TypeError("exporter must be a PhoenixTraceExporter instance")
 
         self._exporter = exporter
-        self._trace_id = trace_id or uuid.uuid4().hex
-        self._clock = clock or time.time
-        self._spans: List[OpenInferenceSpan] = []
+        self._trace_id = trace_id or _generate_trace_id()
+        # time_ns avoids the float conversion inside time.time() and keeps
+        # durations exact under integer subtraction.
+        self._clock = clock or time.time_ns
+        # deque appends are atomic under the GIL, so span completion never
+        # takes a lock, and a bounded ``capacity`` keeps long-running
+        # sessions from growing without limit (oldest spans drop first).
+        self._spans: Deque[OpenInferenceSpan] = deque(maxlen=capacity)
+        # Wire-format snapshots, taken once when each span finishes; submit()
+        # hands these to the exporter so repeated submits never re-serialise.
+        self._wire_spans: Deque[Dict[str, Any]] = deque(maxlen=capacity)
         self._evaluations: List[OpenInferenceEvaluation] = []
         self._span_stack: List[OpenInferenceSpan] = []
 
@@ -147,7 +228,7 @@ class PhoenixTraceSession:
     ) -> Iterator[OpenInferenceSpan]:
         """Context manager for building nested OpenInference spans."""
 
-        start_time = float(self._clock())
+        start_time = self._clock()
         parent = self._span_stack[-1] if self._span_stack else None
         span = OpenInferenceSpan(
             name=name,
@@ -165,17 +246,23 @@ class PhoenixTraceSession:
         try:
             yield span
         finally:
-            span.end_time = float(self._clock())
+            span.end_time = self._clock()
             self._spans.append(span)
+            self._wire_spans.append(span.to_wire())
             self._span_stack.pop()
 
     def submit(self) -> MutableMapping[str, "TransportResponse"]:
-        """Export the captured spans and evaluations via the bound exporter."""
+        """Export the captured spans and evaluations via the bound exporter.
+
+        The internal buffers are handed to the exporter by reference; the
+        exporter only iterates them, so no defensive copies are made.  Spans
+        are submitted in the wire form snapshotted at span end.
+        """
 
         return self._exporter.export(
             self._trace_id,
-            list(self._spans),
-            list(self._evaluations),
+            self._wire_spans,
+            self._evaluations,
         )
 
     # Convenience methods -------------------------------------------------
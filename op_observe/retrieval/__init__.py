@@ -0,0 +1,22 @@
+"""Retrieval primitives for OP-Observe.
+
+This package hosts the in-process vector index and retriever machinery
+used by the RAG evaluation paths.  All heavy optional dependencies
+(numpy and friends) degrade to functional pure-Python fallbacks.
+"""
+
+from .hnsw import HnswIndex
+from .http import HTTPResponse, HTTPSession
+from .memory import Document, InMemoryRetriever
+from .qdrant import LocalQdrantClient, QdrantVectorStore, VectorMatch
+
+__all__ = [
+    "Document",
+    "HnswIndex",
+    "HTTPResponse",
+    "HTTPSession",
+    "InMemoryRetriever",
+    "LocalQdrantClient",
+    "QdrantVectorStore",
+    "VectorMatch",
+]
@@ -0,0 +1,49 @@
+"""Dot-product kernel selection for the vector index hot path.
+
+Exposes ``dot(a, b)`` over contiguous float32 rows, preferring the
+strongest installed backend: simsimd's hand-written AVX-512/NEON
+kernels, then a numba JIT-compiled typed loop that LLVM
+auto-vectorises, then numpy's BLAS-backed dot, and without numpy a
+pure-Python loop.
+"""
+from __future__ import annotations
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when simsimd is installed
+    import simsimd as _simsimd
+except ImportError:  # pragma: no cover - optional dependency
+    _simsimd = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when numba is installed
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore[assignment]
+
+
+if _simsimd is not None and _np is not None:  # pragma: no cover - optional path
+
+    def dot(a, b):
+        return float(_simsimd.dot(a, b))
+
+elif njit is not None and _np is not None:  # pragma: no cover - optional path
+
+    @njit("f4(f4[::1], f4[::1])", fastmath=True, cache=True)
+    def dot(a, b):  # type: ignore[misc]
+        total = 0.0
+        for index in range(a.shape[0]):
+            total += a[index] * b[index]
+        return total
+
+elif _np is not None:  # pragma: no cover - optional path
+
+    def dot(a, b):
+        return float(_np.dot(a, b))
+
+else:
+
+    def dot(a, b):
+        return sum(x * y for x, y in zip(a, b))
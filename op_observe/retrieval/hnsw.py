@@ -0,0 +1,453 @@
+"""Approximate nearest-neighbour index over cosine similarity.
+
+The index keeps a navigable small-world graph over L2-normalised
+vectors.  With numpy installed the vectors live row-wise in a single
+contiguous float32 matrix (structure-of-arrays), so cosine similarity
+reduces to a dot product and every neighbour scan is one BLAS
+matrix-vector product; without numpy the index stores plain tuples and
+loops.
+"""
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from math import sqrt
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
+
+from ._simd import dot as _dot_kernel
+
+Vector = Sequence[float]
+
+# Rows are added in place; the matrix grows by whole chunks so inserts
+# stay amortised O(1).
+_GROW_CHUNK = 1024
+
+# Below this many rows a gathered BLAS matmul costs more in setup than
+# it saves; loop with the pairwise SIMD kernel instead.
+_BLAS_MIN_BATCH = 32
+
+
+class HnswIndex:
+    """Single-layer HNSW-style graph index over cosine similarity.
+
+    Vectors are L2-normalised once on insert, so cosine similarity
+    collapses to a plain dot product against the stored rows.
+
+    With ``dtype="i8"`` rows are scalar-quantised to int8 codes plus one
+    float scale each (``max_abs / 127``), quartering the vector
+    footprint; similarity accumulates in integers and dequantises
+    through the two scales.  ``rerank`` (default on) rescores the
+    shortlist at full precision before returning.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        m: int = 8,
+        ef_search: int = 32,
+        dtype: str = "f4",
+        rerank: bool = True,
+    ) -> None:
+        if dtype not in ("f4", "i8"):
+            raise ValueError(f"unsupported dtype: {dtype!r}")
+        self.dim = dim
+        self.m = m
+        self.ef_search = ef_search
+        self.dtype = dtype
+        self.rerank = rerank
+        # Adjacency lists: neighbour counts are bounded by M, so list
+        # scans beat set hashing and iteration allocates nothing.
+        self._graph: Dict[str, List[str]] = {}
+        self._id_to_row: Dict[str, int] = {}
+        self._row_to_id: List[str] = []
+        self._entrypoint: Optional[str] = None
+        if _np is not None:
+            kind = _np.int8 if dtype == "i8" else _np.float32
+            self._matrix = _np.empty((_GROW_CHUNK, dim), dtype=kind)
+            if dtype == "i8":
+                self._scales = _np.empty(_GROW_CHUNK, dtype=_np.float32)
+        else:
+            self._rows: List[tuple] = []
+            if dtype == "i8":
+                self._scale_list: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._row_to_id)
+
+    def __contains__(self, point_id: str) -> bool:
+        return point_id in self._id_to_row
+
+    # Vector storage ----------------------------------------------------
+    def _normalise(self, vector: Vector):
+        if len(vector) != self.dim:
+            raise ValueError(f"vector length {len(vector)} != dim {self.dim}")
+        if _np is not None:
+            row = _np.asarray(vector, dtype=_np.float32)
+            norm = float(_np.linalg.norm(row))
+            return row / norm if norm else row
+        norm = sqrt(sum(value * value for value in vector))
+        if norm:
+            return tuple(float(value) / norm for value in vector)
+        return tuple(float(value) for value in vector)
+
+    def _quantise(self, row):
+        """Scalar-quantise a normalised row to int8 codes plus one scale."""
+
+        if _np is not None:
+            max_abs = float(_np.max(_np.abs(row)))
+            scale = max_abs / 127.0 if max_abs else 1.0
+            return _np.round(row / scale).astype(_np.int8), scale
+        max_abs = max((abs(value) for value in row), default=0.0)
+        scale = max_abs / 127.0 if max_abs else 1.0
+        return tuple(round(value / scale) for value in row), scale
+
+    def _store_row(self, point_id: str, row) -> int:
+        index = len(self._row_to_id)
+        if self.dtype == "i8":
+            codes, scale = self._quantise(row)
+        if _np is not None:
+            if index == self._matrix.shape[0]:
+                grown = _np.empty(
+                    (self._matrix.shape[0] + _GROW_CHUNK, self.dim),
+                    dtype=self._matrix.dtype,
+                )
+                grown[:index] = self._matrix[:index]
+                self._matrix = grown
+                if self.dtype == "i8":
+                    grown_scales = _np.empty(
+                        self._scales.shape[0] + _GROW_CHUNK, dtype=_np.float32
+                    )
+                    grown_scales[:index] = self._scales[:index]
+                    self._scales = grown_scales
+            if self.dtype == "i8":
+                self._matrix[index] = codes
+                self._scales[index] = scale
+            else:
+                self._matrix[index] = row
+        else:
+            if self.dtype == "i8":
+                self._rows.append(codes)
+                self._scale_list.append(scale)
+            else:
+                self._rows.append(row)
+        self._id_to_row[point_id] = index
+        self._row_to_id.append(point_id)
+        return index
+
+    def _write_row(self, index: int, row) -> None:
+        if self.dtype == "i8":
+            codes, scale = self._quantise(row)
+            if _np is not None:
+                self._matrix[index] = codes
+                self._scales[index] = scale
+            else:
+                self._rows[index] = codes
+                self._scale_list[index] = scale
+        elif _np is not None:
+            self._matrix[index] = row
+        else:
+            self._rows[index] = row
+
+    # Scoring -----------------------------------------------------------
+    def _prepare_query(self, row):
+        """Turn a normalised vector into the dtype's query state."""
+
+        if self.dtype != "i8":
+            return row
+        codes, scale = self._quantise(row)
+        if _np is not None:
+            # int32 once up front so the integer dot accumulates without
+            # overflow.
+            return codes.astype(_np.int32), scale, row
+        return codes, scale, row
+
+    def _row_query(self, index: int):
+        """Query state for a stored row (used when a point is the anchor)."""
+
+        if self.dtype != "i8":
+            return self._matrix[index] if _np is not None else self._rows[index]
+        if _np is not None:
+            return (
+                self._matrix[index].astype(_np.int32),
+                float(self._scales[index]),
+                None,
+            )
+        return self._rows[index], self._scale_list[index], None
+
+    def _dot_row(self, index: int, query) -> float:
+        if self.dtype == "i8":
+            q_codes, q_scale = query[0], query[1]
+            if _np is not None:
+                dot = int(self._matrix[index].astype(_np.int32) @ q_codes)
+                return dot * (float(self._scales[index]) * q_scale)
+            dot = sum(x * y for x, y in zip(self._rows[index], q_codes))
+            return dot * (self._scale_list[index] * q_scale)
+        if _np is not None:
+            # Rows of the C-contiguous matrix satisfy the kernel's
+            # contiguity contract, so pairwise distances go through the
+            # JIT/SIMD path when numba is present.
+            return float(_dot_kernel(self._matrix[index], query))
+        return sum(x * y for x, y in zip(self._rows[index], query))
+
+    def _dot_id(self, point_id: str, query) -> float:
+        return self._dot_row(self._id_to_row[point_id], query)
+
+    def _exact_dot(self, index: int, row) -> float:
+        """Full-precision dot of a stored row against a float query."""
+
+        if self.dtype != "i8":
+            return self._dot_row(index, row)
+        if _np is not None:
+            dequantised = self._matrix[index].astype(_np.float32) * float(
+                self._scales[index]
+            )
+            return float(dequantised @ row)
+        scale = self._scale_list[index]
+        return sum(code * scale * value for code, value in zip(self._rows[index], row))
+
+    # Graph maintenance -------------------------------------------------
+    def _select_neighbors(self, query, exclude_id: Optional[str]) -> List[str]:
+        """Top-M link candidates found by greedy traversal from the entrypoint.
+
+        Reuses the beam search instead of scanning every stored vector,
+        so insertion cost follows the graph diameter rather than the
+        index size.
+        """
+
+        best = self._beam(query, max(self.m * 2, self.ef_search), exclude_id)
+        ranked = sorted(best, reverse=True)
+        return [point_id for _, point_id in ranked[: self.m]]
+
+    def _trim(self, point_id: str) -> None:
+        neighbours = self._graph.get(point_id)
+        if neighbours is None or len(neighbours) <= self.m:
+            return
+        anchor = self._row_query(self._id_to_row[point_id])
+        scored = sorted(
+            ((self._dot_id(other, anchor), other) for other in neighbours),
+            reverse=True,
+        )
+        kept = [other for _, other in scored[: self.m]]
+        kept_set = set(kept)
+        for other in neighbours:
+            if other not in kept_set:
+                self._drop_edge(other, point_id)
+        self._graph[point_id] = kept
+
+    def _drop_edge(self, from_id: str, to_id: str) -> None:
+        peers = self._graph.get(from_id)
+        if peers is not None:
+            try:
+                peers.remove(to_id)
+            except ValueError:
+                pass
+
+    def _unlink(self, point_id: str) -> None:
+        for other in self._graph.pop(point_id, ()):  # pragma: no branch
+            self._drop_edge(other, point_id)
+
+    # Public API --------------------------------------------------------
+    def add_point(self, point_id: str, vector: Vector) -> None:
+        """Insert (or overwrite) a point and wire it into the graph."""
+
+        row = self._normalise(vector)
+        index = self._id_to_row.get(point_id)
+        if index is None:
+            index = self._store_row(point_id, row)
+        else:
+            self._write_row(index, row)
+            self._unlink(point_id)
+        neighbours = self._select_neighbors(self._prepare_query(row), point_id)
+        self._graph[point_id] = list(neighbours)
+        for other in neighbours:
+            peers = self._graph.setdefault(other, [])
+            if point_id not in peers:
+                peers.append(point_id)
+            self._trim(other)
+        self._trim(point_id)
+        if self._entrypoint is None:
+            self._entrypoint = point_id
+
+    def update_point(self, point_id: str, vector: Vector) -> None:
+        """Replace a point's vector and relink its neighbourhood."""
+
+        self.add_point(point_id, vector)
+
+    def compact(self) -> None:
+        """Reorder storage into BFS visit order from the entrypoint.
+
+        Graph neighbours end up in adjacent rows, so beam expansions
+        gather mostly-sequential cache lines instead of scattered ones.
+        Worth calling once after bulk inserts; ids and scores are
+        unchanged.
+        """
+
+        if self._entrypoint is None:
+            return
+        order: List[str] = []
+        seen = {self._entrypoint}
+        queue = deque((self._entrypoint,))
+        while queue:
+            point_id = queue.popleft()
+            order.append(point_id)
+            for neighbour in self._graph.get(point_id, ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        # Points unreachable from the entrypoint keep their relative order.
+        for point_id in self._row_to_id:
+            if point_id not in seen:
+                order.append(point_id)
+        old_rows = [self._id_to_row[point_id] for point_id in order]
+        if _np is not None:
+            count = len(self._row_to_id)
+            # One aligned contiguous reallocation in the new order.
+            self._matrix = _np.require(
+                _np.take(self._matrix[:count], old_rows, axis=0),
+                requirements=["A", "C"],
+            )
+            if self.dtype == "i8":
+                self._scales = _np.require(
+                    _np.take(self._scales[:count], old_rows),
+                    requirements=["A", "C"],
+                )
+        else:
+            self._rows = [self._rows[row] for row in old_rows]
+            if self.dtype == "i8":
+                self._scale_list = [self._scale_list[row] for row in old_rows]
+        self._row_to_id = order
+        self._id_to_row = {point_id: row for row, point_id in enumerate(order)}
+
+    def vector_view(self, point_id: str) -> Vector:
+        """Zero-copy view of a stored (normalised) vector.
+
+        Returns the matrix row itself (or the stored tuple without
+        numpy); callers must treat it as read-only and copy explicitly
+        if they need an independent vector.  In int8 mode the row is
+        dequantised, which does allocate.
+        """
+
+        index = self._id_to_row[point_id]
+        if self.dtype == "i8":
+            if _np is not None:
+                return self._matrix[index].astype(_np.float32) * float(
+                    self._scales[index]
+                )
+            scale = self._scale_list[index]
+            return tuple(code * scale for code in self._rows[index])
+        return self._matrix[index] if _np is not None else self._rows[index]
+
+    @staticmethod
+    def _push(
+        heap: List[Tuple[float, str]], item: Tuple[float, str], maxsize: int
+    ) -> None:
+        """Keep the ``maxsize`` best items in a min-heap, O(log n) per push."""
+
+        if len(heap) < maxsize:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heappushpop(heap, item)
+
+    def _beam(
+        self, query, ef: int, exclude_id: Optional[str] = None
+    ) -> List[Tuple[float, str]]:
+        """Best-first expansion from the entrypoint; returns a bounded heap."""
+
+        entry = self._entrypoint
+        if entry is None:
+            return []
+        entry_score = self._dot_id(entry, query)
+        visited = {entry}
+        candidates: List[Tuple[float, str]] = [(-entry_score, entry)]
+        best: List[Tuple[float, str]] = []
+        if entry != exclude_id:
+            self._push(best, (entry_score, entry), ef)
+        while candidates:
+            neg_score, current = heapq.heappop(candidates)
+            # best[0] is the worst retained item (min-heap root).
+            if len(best) >= ef and -neg_score < best[0][0]:
+                break
+            # current is already in visited, so iterating its adjacency
+            # list directly needs no union with {current}.
+            fresh = [
+                neighbour
+                for neighbour in self._graph.get(current, ())
+                if neighbour not in visited
+            ]
+            if not fresh:
+                continue
+            visited.update(fresh)
+            if _np is not None:
+                rows = [self._id_to_row[neighbour] for neighbour in fresh]
+                if self.dtype == "i8":
+                    # Integer dot with 32-bit accumulation over the whole
+                    # batch, then one elementwise dequantise.
+                    block = _np.take(self._matrix, rows, axis=0).astype(
+                        _np.int32
+                    )
+                    dots = block @ query[0]
+                    scales = _np.take(self._scales, rows) * query[1]
+                    scored = zip(
+                        fresh, (float(value) for value in dots * scales)
+                    )
+                elif len(rows) < _BLAS_MIN_BATCH:
+                    # Too small to amortise matmul setup; the pairwise
+                    # SIMD kernel wins here.
+                    matrix = self._matrix
+                    scored = [
+                        (neighbour, float(_dot_kernel(matrix[row], query)))
+                        for neighbour, row in zip(fresh, rows)
+                    ]
+                else:
+                    # Gather the scattered rows into one contiguous block
+                    # before the dot-product: take() issues all the row
+                    # loads up front (overlapping their DRAM fetches) and
+                    # the matmul then streams a contiguous operand.
+                    block = _np.take(self._matrix, rows, axis=0)
+                    scores = block @ query
+                    scored = zip(fresh, (float(score) for score in scores))
+                # Prefetch the likely next expansion: touching the current
+                # best candidate's unvisited neighbour rows now pulls
+                # their cache lines while the heap bookkeeping below runs.
+                if candidates:
+                    upcoming = [
+                        self._id_to_row[point_id]
+                        for point_id in self._graph.get(candidates[0][1], ())
+                        if point_id not in visited
+                    ]
+                    if upcoming:
+                        _np.take(self._matrix, upcoming[:8], axis=0)
+            else:
+                scored = (
+                    (neighbour, self._dot_id(neighbour, query))
+                    for neighbour in fresh
+                )
+            for neighbour, score in scored:
+                if neighbour != exclude_id:
+                    self._push(best, (score, neighbour), ef)
+                heapq.heappush(candidates, (-score, neighbour))
+        return best
+
+    def search(self, vector: Vector, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Beam-search the graph, returning ``(point_id, score)`` best-first."""
+
+        row = self._normalise(vector)
+        best = self._beam(self._prepare_query(row), max(self.ef_search, top_k))
+        ranked = sorted(best, reverse=True)
+        if self.dtype == "i8" and self.rerank:
+            # Rescore the shortlist at full precision: dequantised rows
+            # against the float query drop the query-side quantisation
+            # error from the final ordering.
+            ranked = sorted(
+                (
+                    (self._exact_dot(self._id_to_row[point_id], row), point_id)
+                    for _, point_id in ranked
+                ),
+                reverse=True,
+            )
+        return [(point_id, score) for score, point_id in ranked[:top_k]]
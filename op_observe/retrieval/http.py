@@ -0,0 +1,190 @@
+"""Minimal HTTP session with persistent keep-alive connections.
+
+Exporters and remote vector-store clients fire many small requests at
+the same handful of endpoints; re-resolving DNS and re-negotiating
+TCP/TLS per call would dwarf the payload work.  The session caches one
+``http.client`` connection per ``(scheme, host, port)`` and reuses it,
+resetting a connection once when the server has dropped the keep-alive.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from http.client import (
+    BadStatusLine,
+    HTTPConnection,
+    HTTPSConnection,
+    RemoteDisconnected,
+)
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.request import Request, urlopen
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _dumps(payload: object) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+
+# Errors that mean the pooled connection went stale, not that the
+# request itself is bad; one reconnect-and-retry is standard hygiene.
+_STALE_ERRORS = (BadStatusLine, RemoteDisconnected, ConnectionResetError)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    """Status, headers and raw body of a completed request."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+    def json(self) -> object:
+        return json.loads(self.body)
+
+
+class HTTPSession:
+    """Reusable HTTP client bound to a set of base headers."""
+
+    def __init__(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self._connections: Dict[Tuple[str, str, int], HTTPConnection] = {}
+        # The base headers are fixed after construction, so the merged
+        # dicts for the no-override case are built once and shared; the
+        # transport only reads them.
+        self._base_headers_plain = dict(self.headers)
+        self._base_headers_json = dict(self.headers)
+        self._base_headers_json.setdefault("Content-Type", "application/json")
+
+    # Connection pool ---------------------------------------------------
+    def _connection(self, scheme: str, host: str, port: int) -> HTTPConnection:
+        key = (scheme, host, port)
+        connection = self._connections.get(key)
+        if connection is None:
+            factory = HTTPSConnection if scheme == "https" else HTTPConnection
+            connection = factory(host, port, timeout=self.timeout)
+            self._connections[key] = connection
+        return connection
+
+    def _drop_connection(self, scheme: str, host: str, port: int) -> None:
+        connection = self._connections.pop((scheme, host, port), None)
+        if connection is not None:
+            connection.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    # Request building --------------------------------------------------
+    def _encode_json(self, payload: object) -> bytes:
+        # orjson already returns bytes; the json fallback encodes once.
+        return _dumps(payload)
+
+    def _apply_params(self, url: str, params: Mapping[str, object]) -> str:
+        if "?" not in url and "#" not in url:
+            # Common case: nothing to merge, so encode and concatenate
+            # without the urlsplit/urlunsplit round trip.
+            return f"{url}?{urlencode(params, doseq=True)}"
+        parsed = urlsplit(url)
+        query = dict(parse_qsl(parsed.query))
+        # urlencode stringifies values itself, so no per-item str() pass.
+        query.update(params)
+        return urlunsplit(parsed._replace(query=urlencode(query, doseq=True)))
+
+    def _merged_headers(
+        self, headers: Optional[Mapping[str, str]], has_body: bool
+    ) -> Dict[str, str]:
+        if headers is None:
+            return (
+                self._base_headers_json if has_body else self._base_headers_plain
+            )
+        merged = dict(self.headers)
+        merged.update(headers)
+        if has_body:
+            merged.setdefault("Content-Type", "application/json")
+        return merged
+
+    # Public API --------------------------------------------------------
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, object]] = None,
+        json_payload: Optional[object] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> HTTPResponse:
+        """Issue a request over a pooled connection and read the body."""
+
+        if params:
+            url = self._apply_params(url, params)
+        parsed = urlsplit(url)
+        scheme = parsed.scheme
+        if scheme not in _DEFAULT_PORTS:
+            return self._request_via_urlopen(method, url, json_payload, headers)
+        body = (
+            self._encode_json(json_payload) if json_payload is not None else None
+        )
+        merged = self._merged_headers(headers, body is not None)
+        host = parsed.hostname or ""
+        port = parsed.port or _DEFAULT_PORTS[scheme]
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        for attempt in (0, 1):
+            connection = self._connection(scheme, host, port)
+            try:
+                connection.request(method, path, body, merged)
+                response = connection.getresponse()
+                payload = response.read()
+            except _STALE_ERRORS:
+                # The server closed the idle connection; rebuild once.
+                self._drop_connection(scheme, host, port)
+                if attempt:
+                    raise
+                continue
+            return HTTPResponse(
+                status=response.status,
+                headers=dict(response.getheaders()),
+                body=payload,
+            )
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _request_via_urlopen(
+        self,
+        method: str,
+        url: str,
+        json_payload: Optional[object],
+        headers: Optional[Mapping[str, str]],
+    ) -> HTTPResponse:
+        """Fallback for schemes the pooled client does not speak."""
+
+        body = (
+            self._encode_json(json_payload) if json_payload is not None else None
+        )
+        request = Request(
+            url,
+            data=body,
+            headers=self._merged_headers(headers, body is not None),
+            method=method,
+        )
+        with urlopen(request, timeout=self.timeout) as response:
+            return HTTPResponse(
+                status=getattr(response, "status", 200),
+                headers=dict(response.headers.items()),
+                body=response.read(),
+            )
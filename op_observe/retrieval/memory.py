@@ -0,0 +1,76 @@
+"""Token-overlap retriever over an in-memory document corpus.
+
+Documents are tokenised once at construction: the retriever keeps the
+per-document token sets, their normalisation factors and an inverted
+index from token to posting list, so a query only visits the documents
+that share at least one token with it instead of rescoring the whole
+corpus.
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from math import sqrt
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Document:
+    """A retrievable piece of text with optional metadata."""
+
+    doc_id: str
+    text: str
+    metadata: Mapping[str, str] = field(default_factory=dict)
+
+
+class InMemoryRetriever:
+    """Score documents by normalised token overlap with the query.
+
+    The score is the cosine similarity of the binary token vectors:
+    ``|query ∩ doc| / (sqrt(|doc|) * sqrt(|query|))``.
+    """
+
+    def __init__(self, documents: Sequence[Document]) -> None:
+        self._documents = list(documents)
+        self._doc_tokens: List[frozenset] = []
+        self._inv_norm: List[float] = []
+        self._postings: Dict[str, List[int]] = {}
+        for index, document in enumerate(self._documents):
+            tokens = frozenset(document.text.lower().split())
+            self._doc_tokens.append(tokens)
+            self._inv_norm.append(1.0 / sqrt(len(tokens) or 1))
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = []
+                    self._postings[token] = postings
+                postings.append(index)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def retrieve(self, query: str, top_k: int = 5) -> List[Tuple[Document, float]]:
+        """Return the best-matching documents with their scores."""
+
+        query_terms = frozenset(query.lower().split())
+        if not query_terms:
+            return []
+        # Accumulate overlap counts over posting lists: only documents
+        # sharing at least one token are ever touched.
+        hits: Dict[int, int] = {}
+        postings_get = self._postings.get
+        for term in query_terms:
+            for index in postings_get(term, ()):
+                hits[index] = hits.get(index, 0) + 1
+        if not hits:
+            return []
+        query_inv_norm = 1.0 / sqrt(len(query_terms))
+        inv_norm = self._inv_norm
+        best = heapq.nlargest(
+            top_k,
+            (
+                (overlap * inv_norm[index] * query_inv_norm, index)
+                for index, overlap in hits.items()
+            ),
+        )
+        return [(self._documents[index], score) for score, index in best]
@@ -0,0 +1,96 @@
+"""Qdrant-compatible vector store facades.
+
+``LocalQdrantClient`` is an in-process stand-in for a Qdrant server
+backed by :class:`~op_observe.retrieval.hnsw.HnswIndex`.  Search results
+hand back read-only views of the stored state — payloads wrapped in
+``MappingProxyType`` and vectors aliasing the index's own rows — so the
+hot RAG path allocates nothing per match.  Callers that need an
+independent copy take one explicitly (``dict(match.payload)``,
+``list(match.vector)``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from .hnsw import HnswIndex, Vector
+from .memory import Document
+
+
+@dataclass(frozen=True)
+class VectorMatch:
+    """One search hit: id, score and read-only payload/vector views."""
+
+    point_id: str
+    score: float
+    payload: Mapping[str, object]
+    vector: Vector
+
+
+class LocalQdrantClient:
+    """In-process Qdrant-style client over an HNSW index."""
+
+    def __init__(self, dim: int, **index_kwargs: object) -> None:
+        self._index = HnswIndex(dim, **index_kwargs)  # type: ignore[arg-type]
+        self._payloads: Dict[str, Dict[str, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def upsert(
+        self,
+        point_id: str,
+        vector: Vector,
+        payload: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        self._payloads[point_id] = dict(payload or {})
+        self._index.add_point(point_id, vector)
+
+    def compact(self) -> None:
+        """Re-lay the index rows out in graph order (see HnswIndex.compact)."""
+
+        self._index.compact()
+
+    def search(self, vector: Vector, top_k: int = 5) -> List[VectorMatch]:
+        """Return the best matches as read-only views over stored state."""
+
+        return [
+            VectorMatch(
+                point_id=point_id,
+                score=score,
+                payload=MappingProxyType(self._payloads[point_id]),
+                vector=self._index.vector_view(point_id),
+            )
+            for point_id, score in self._index.search(vector, top_k)
+        ]
+
+
+class QdrantVectorStore:
+    """Document-level facade over a Qdrant-style client."""
+
+    def __init__(self, client: LocalQdrantClient) -> None:
+        self._client = client
+
+    def upsert_documents(
+        self, documents: Sequence[Document], vectors: Sequence[Vector]
+    ) -> None:
+        """Store documents with their embeddings, text in the payload."""
+
+        if len(documents) != len(vectors):
+            raise ValueError(
+                f"document/vector counts differ: "
+                f"{len(documents)} != {len(vectors)}"
+            )
+        for document, vector in zip(documents, vectors):
+            self._client.upsert(
+                document.doc_id,
+                vector,
+                payload={"text": document.text, **document.metadata},
+            )
+        # Bulk loads leave rows in insertion order; compacting once here
+        # restores graph locality for the searches that follow.
+        self._client.compact()
+
+    def search(self, vector: Vector, top_k: int = 5) -> List[VectorMatch]:
+        return self._client.search(vector, top_k)
@@ -0,0 +1,61 @@
+"""JSON helpers for security config and audit IO with an orjson fast path.
+
+orjson parses bytes directly and serialises several times faster than the
+stdlib; when it is not installed the helpers degrade to :mod:`json` with
+identical semantics (both emit key-sorted output and accept bytes input).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when pysimdjson is installed
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None  # type: ignore[assignment]
+    _PARSER = None
+else:
+    # One reusable Parser amortises the tape allocation across documents.
+    # Only one document is live at a time in the loaders below, so reusing
+    # the tape is safe.
+    _PARSER = simdjson.Parser()
+
+
+if orjson is not None:
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps_sorted(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+else:
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+
+def load_path(path: Path) -> Any:
+    """Parse the JSON document at *path* (bytes mode, no text decode pass)."""
+
+    data = path.read_bytes()
+    if _PARSER is not None:
+        document = _PARSER.parse(data)
+        # Materialise eagerly; lazy simdjson proxies must not outlive the
+        # next parse on the shared tape.
+        if isinstance(document, simdjson.Object):
+            return document.as_dict()
+        if isinstance(document, simdjson.Array):
+            return document.as_list()
+        return document
+    return loads(data)
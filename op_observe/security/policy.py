@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence, Tuple
+from typing import Mapping, Sequence, Tuple
+
+from ._json import load_path
 
 
 @dataclass(frozen=True)
@@ -49,6 +50,50 @@ class PolicyRequest:
     action: str
 
 
+@dataclass(frozen=True)
+class _CompiledConstraint:
+    """Constraint with membership tables precomputed for evaluation.
+
+    Built once per bundle so the hot loop does O(1) set probes instead of
+    rebuilding tuples and lowering role names per constraint per request.
+    """
+
+    constraint: Constraint
+    kinds: frozenset
+    namespaces: frozenset
+    prohibited_by_len: Mapping[int, Tuple[str, ...] | frozenset]
+    prohibited_order: Tuple[str, ...]
+    allowed_roles_lower: frozenset
+    require_gatekeeper: bool
+
+    @classmethod
+    def compile(cls, constraint: Constraint) -> "_CompiledConstraint":
+        match = constraint.match
+        parameters = constraint.parameters
+        prohibited = tuple(parameters.get("prohibitedAnnotations", ()))
+        # Bucket prohibited names by length: a probe first matches on
+        # len(key), and tiny buckets stay tuples so membership is a couple
+        # of direct comparisons rather than a hash of the whole string.
+        buckets: dict[int, list[str]] = {}
+        for name in prohibited:
+            buckets.setdefault(len(name), []).append(name)
+        by_len = {
+            length: tuple(group) if len(group) < 4 else frozenset(group)
+            for length, group in buckets.items()
+        }
+        return cls(
+            constraint=constraint,
+            kinds=frozenset(match.get("kinds", {}).get("kinds", ())),
+            namespaces=frozenset(match.get("namespaces", ())),
+            prohibited_by_len=by_len,
+            prohibited_order=prohibited,
+            allowed_roles_lower=frozenset(
+                role.lower() for role in parameters.get("allowedRoles", ())
+            ),
+            require_gatekeeper=bool(parameters.get("requireGatekeeper", False)),
+        )
+
+
 @dataclass(frozen=True)
 class PolicyViolation:
     """Result describing a policy violation."""
@@ -69,9 +114,31 @@ class PolicyDecision:
         return tuple(violation.reason for violation in self.violations)
 
 
+_GATEKEEPER_REASON = "Resource creation denied: missing Gatekeeper approval annotation"
+_ROLE_REASON = "User does not satisfy allowedRoles"
+
+
+def _first_prohibited(order: Tuple[str, ...], annotations: Mapping[str, str]) -> str:
+    """Return the first prohibited annotation present, in declaration order."""
+
+    return next(name for name in order if name in annotations)
+
+
+def _match_prohibited(
+    by_len: Mapping[int, Tuple[str, ...] | frozenset],
+    annotations: Mapping[str, str],
+) -> bool:
+    """Check request annotations against a length-bucketed prohibited table."""
+
+    for key in annotations:
+        group = by_len.get(len(key))
+        if group is not None and key in group:
+            return True
+    return False
+
+
 def _load_json(path: Path) -> Mapping[str, object]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return load_path(path)
 
 
 def load_policy_bundle(config_dir: Path) -> PolicyBundle:
@@ -112,63 +179,186 @@ def load_policy_bundle(config_dir: Path) -> PolicyBundle:
 class PolicyEngine:
     """Tiny policy evaluator that simulates Gatekeeper decisions."""
 
+    # Memoised decisions; evaluation is deterministic for a fixed bundle, so
+    # repeat requests collapse to a dict probe.  Bounded with FIFO eviction.
+    _CACHE_MAX = 1024
+
     def __init__(self, bundle: PolicyBundle):
         self._bundle = bundle
+        compiled = [
+            _CompiledConstraint.compile(constraint)
+            for constraint in bundle.constraints
+        ]
+        # Structure-of-arrays layout: parallel tuples indexed by constraint,
+        # so the evaluation loop does tuple indexing instead of attribute
+        # lookups, and trivially satisfiable constraints skip in one probe.
+        self._n = len(compiled)
+        self._constraints = tuple(c.constraint for c in compiled)
+        self._kinds = tuple(c.kinds for c in compiled)
+        self._namespaces = tuple(c.namespaces for c in compiled)
+        self._prohibited_by_len = tuple(c.prohibited_by_len for c in compiled)
+        self._prohibited_order = tuple(c.prohibited_order for c in compiled)
+        self._allowed_roles = tuple(c.allowed_roles_lower for c in compiled)
+        self._require_gatekeeper = tuple(c.require_gatekeeper for c in compiled)
+        self._trivial = tuple(
+            not (c.require_gatekeeper or c.prohibited_order or c.allowed_roles_lower)
+            for c in compiled
+        )
+        self._cache: dict[tuple, PolicyDecision] = {}
+        # The bundle is fixed for the engine's lifetime, so a specialised
+        # evaluation function is generated once with the constraint sets
+        # bound as constants and the per-constraint branches unrolled.
+        self._eval_fn = self._compile_eval()
+
+    @staticmethod
+    def _cache_key(request: PolicyRequest) -> tuple:
+        # Canonical tuple of every request field the evaluation reads.
+        return (
+            request.resource_kind,
+            request.namespace,
+            request.action,
+            frozenset(request.annotations.items()),
+            tuple(sorted(role.lower() for role in request.roles)),
+        )
 
     def evaluate(self, request: PolicyRequest) -> PolicyDecision:
-        violations: list[PolicyViolation] = []
-
-        for constraint in self._bundle.constraints:
-            match = constraint.match
-            kinds = tuple(match.get("kinds", {}).get("kinds", ()))
-            namespaces = tuple(match.get("namespaces", ()))
-
-            if kinds and request.resource_kind not in kinds:
+        key = self._cache_key(request)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        decision = self._evaluate(request)
+        if len(self._cache) >= self._CACHE_MAX:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = decision
+        return decision
+
+    def evaluate_allow(self, request: PolicyRequest) -> bool:
+        """Allow/deny check that stops at the first violation.
+
+        Callers that only branch on the boolean outcome avoid the violation
+        list and :class:`PolicyViolation` construction of :meth:`evaluate`;
+        cached full decisions are reused when available.
+        """
+
+        cached = self._cache.get(self._cache_key(request))
+        if cached is not None:
+            return cached.allowed
+
+        annotations = request.annotations
+        roles_lower = {role.lower() for role in request.roles}
+        resource_kind = request.resource_kind
+        namespace = request.namespace
+        is_create = request.action == "create"
+
+        kinds = self._kinds
+        namespaces = self._namespaces
+        prohibited = self._prohibited_by_len
+        allowed_roles = self._allowed_roles
+
+        for i in range(self._n):
+            if self._trivial[i]:
                 continue
-            if namespaces and request.namespace not in namespaces:
+            if kinds[i] and resource_kind not in kinds[i]:
                 continue
-
-            parameters = constraint.parameters
-            allowed_roles: Iterable[str] = parameters.get("allowedRoles", ())
-            prohibited_annotations: Iterable[str] = parameters.get(
-                "prohibitedAnnotations", ()
+            if namespaces[i] and namespace not in namespaces[i]:
+                continue
+            if self._require_gatekeeper[i] and is_create:
+                if not annotations.get("gatekeeper/approved"):
+                    return False
+            if prohibited[i] and _match_prohibited(prohibited[i], annotations):
+                return False
+            if allowed_roles[i] and roles_lower.isdisjoint(allowed_roles[i]):
+                return False
+        return True
+
+    def _constraint_checks(self, index: int) -> list[str]:
+        """Source lines for the prohibited/role checks of one constraint."""
+
+        lines: list[str] = []
+        if self._prohibited_order[index]:
+            lines.append(f"if _MP(_PL{index}, annotations):")
+            lines.append(
+                f"    v.append(_V(_C{index}, \"Annotation '\""
+                f" + _FIRST(_PO{index}, annotations)"
+                f" + \"' is prohibited by policy\"))"
             )
-            required_gatekeeper = parameters.get("requireGatekeeper", False)
-
-            if required_gatekeeper and request.action == "create":
-                if not request.annotations.get("gatekeeper/approved"):
-                    violations.append(
-                        PolicyViolation(
-                            constraint=constraint,
-                            reason=(
-                                "Resource creation denied: missing Gatekeeper approval annotation"
-                            ),
-                        )
-                    )
-                    continue
-
-            if prohibited_annotations:
-                for annotation in prohibited_annotations:
-                    if annotation in request.annotations:
-                        violations.append(
-                            PolicyViolation(
-                                constraint=constraint,
-                                reason=(
-                                    f"Annotation '{annotation}' is prohibited by policy"
-                                ),
-                            )
-                        )
-                        break
-
-            if allowed_roles:
-                role_set = set(role.lower() for role in request.roles)
-                if not any(role.lower() in role_set for role in allowed_roles):
-                    violations.append(
-                        PolicyViolation(
-                            constraint=constraint,
-                            reason="User does not satisfy allowedRoles",
-                        )
-                    )
-
-        allowed = not violations
-        return PolicyDecision(allowed=allowed, violations=tuple(violations))
+        if self._allowed_roles[index]:
+            lines.append(f"if roles_lower.isdisjoint(_A{index}):")
+            lines.append(f"    v.append(_V(_C{index}, _ROLE_REASON))")
+        return lines
+
+    def _compile_eval(self):
+        """Generate the bundle-specialised evaluation function.
+
+        Each non-trivial constraint becomes an unrolled block with its
+        membership sets bound as function globals, so evaluation pays no
+        per-constraint attribute lookups or loop dispatch.
+        """
+
+        env: dict[str, object] = {
+            "_V": PolicyViolation,
+            "_FIRST": _first_prohibited,
+            "_MP": _match_prohibited,
+            "_GK_REASON": _GATEKEEPER_REASON,
+            "_ROLE_REASON": _ROLE_REASON,
+        }
+        lines = [
+            "def _eval(resource_kind, namespace, annotations, roles_lower, is_create):",
+            "    v = []",
+        ]
+        for i in range(self._n):
+            if self._trivial[i]:
+                continue
+            env[f"_C{i}"] = self._constraints[i]
+            if self._prohibited_order[i]:
+                env[f"_PL{i}"] = self._prohibited_by_len[i]
+                env[f"_PO{i}"] = self._prohibited_order[i]
+            if self._allowed_roles[i]:
+                env[f"_A{i}"] = self._allowed_roles[i]
+
+            conditions = []
+            if self._kinds[i]:
+                env[f"_K{i}"] = self._kinds[i]
+                conditions.append(f"resource_kind in _K{i}")
+            if self._namespaces[i]:
+                env[f"_N{i}"] = self._namespaces[i]
+                conditions.append(f"namespace in _N{i}")
+
+            block: list[str] = []
+            checks = self._constraint_checks(i)
+            if self._require_gatekeeper[i]:
+                block.append(
+                    "if is_create and not annotations.get('gatekeeper/approved'):"
+                )
+                block.append(f"    v.append(_V(_C{i}, _GK_REASON))")
+                block.append("else:")
+                if checks:
+                    block.extend("    " + line for line in checks)
+                else:
+                    block.append("    pass")
+            else:
+                block.extend(checks)
+
+            # ascii() keeps the comment on one line: constraint names come
+            # from configuration, so a raw newline in one would otherwise
+            # let config data inject statements into the compiled source.
+            lines.append(f"    # constraint {i}: {ascii(self._constraints[i].name)}")
+            if conditions:
+                lines.append(f"    if {' and '.join(conditions)}:")
+                lines.extend("        " + line for line in block)
+            else:
+                lines.extend("    " + line for line in block)
+        lines.append("    return v")
+
+        exec(compile("\n".join(lines), "<policy>", "exec"), env)
+        return env["_eval"]
+
+    def _evaluate(self, request: PolicyRequest) -> PolicyDecision:
+        violations = self._eval_fn(
+            request.resource_kind,
+            request.namespace,
+            request.annotations,
+            {role.lower() for role in request.roles},
+            request.action == "create",
+        )
+        return PolicyDecision(allowed=not violations, violations=tuple(violations))
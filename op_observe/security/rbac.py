@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import cached_property
+from hashlib import blake2b
 from pathlib import Path
-from typing import Iterable, Mapping, MutableMapping, Sequence, Tuple
+from typing import FrozenSet, Iterable, Mapping, Sequence, Tuple
 
+from ..utils import LRUCache
+from ._json import load_path
 from .keycloak import KeycloakClient, KeycloakUser
 from .policy import Constraint, PolicyDecision, PolicyEngine, PolicyRequest, PolicyViolation
 
@@ -18,14 +21,18 @@ class RBACRole:
     name: str
     permissions: Tuple[str, ...]
 
+    @cached_property
+    def permissions_set(self) -> FrozenSet[str]:
+        return frozenset(self.permissions)
+
 
 @dataclass(frozen=True)
 class RBACBinding:
     """Binding between a role and resource selectors."""
 
     role: str
-    resources: Tuple[str, ...]
-    actions: Tuple[str, ...]
+    resources: FrozenSet[str]
+    actions: FrozenSet[str]
 
 
 @dataclass(frozen=True)
@@ -35,15 +42,39 @@ class RBACConfig:
     roles: Mapping[str, RBACRole]
     bindings: Tuple[RBACBinding, ...]
 
+    @cached_property
+    def _permissions_cache(self) -> dict:
+        return {}
+
+    def permissions_set_for_roles(self, user_roles: Iterable[str]) -> FrozenSet[str]:
+        """Union of permissions for ``user_roles`` as a cached frozenset."""
+
+        key = tuple(sorted(user_roles))
+        cached = self._permissions_cache.get(key)
+        if cached is None:
+            cached = frozenset().union(
+                *(
+                    self.roles[role].permissions_set
+                    for role in key
+                    if role in self.roles
+                )
+            )
+            if len(self._permissions_cache) >= 512:
+                self._permissions_cache.clear()
+            self._permissions_cache[key] = cached
+        return cached
+
     def permissions_for_roles(self, user_roles: Iterable[str]) -> Tuple[str, ...]:
-        collected: list[str] = []
-        for role in user_roles:
-            if role in self.roles:
-                collected.extend(self.roles[role].permissions)
-        return tuple(sorted(set(collected)))
+        return tuple(sorted(self.permissions_set_for_roles(user_roles)))
+
+    @cached_property
+    def _role_index(self) -> Mapping[str, RBACBinding]:
+        # Built lazily on first use; the config is frozen so the index never
+        # goes stale.
+        return {binding.role: binding for binding in self.bindings}
 
     def bindings_for_roles(self, user_roles: Iterable[str]) -> Tuple[RBACBinding, ...]:
-        lookup = {binding.role: binding for binding in self.bindings}
+        lookup = self._role_index
         selected = []
         for role in user_roles:
             binding = lookup.get(role)
@@ -55,8 +86,8 @@ class RBACConfig:
 def load_rbac_config(config_dir: Path) -> RBACConfig:
     """Load RBAC configuration from JSON files."""
 
-    roles_raw = json.loads((config_dir / "roles.json").read_text("utf-8"))
-    bindings_raw = json.loads((config_dir / "bindings.json").read_text("utf-8"))
+    roles_raw = load_path(config_dir / "roles.json")
+    bindings_raw = load_path(config_dir / "bindings.json")
 
     roles = {
         role_data["name"]: RBACRole(
@@ -69,8 +100,8 @@ def load_rbac_config(config_dir: Path) -> RBACConfig:
     bindings = tuple(
         RBACBinding(
             role=binding["role"],
-            resources=tuple(binding.get("resources", ())),
-            actions=tuple(binding.get("actions", ())),
+            resources=frozenset(binding.get("resources", ())),
+            actions=frozenset(binding.get("actions", ())),
         )
         for binding in bindings_raw["bindings"]
     )
@@ -91,25 +122,30 @@ class RBACEnforcer:
         self._keycloak = keycloak
         self._policy_engine = policy_engine
         self._rbac_config = rbac_config
-        self._decision_cache: MutableMapping[Tuple[str, str, str], PolicyDecision] = {}
+        self._decision_cache: LRUCache = LRUCache(maxsize=1024)
 
     def authorize(self, token: str, *, action: str, resource: str) -> PolicyDecision:
         """Authorize an action for the user represented by ``token``."""
 
-        cache_key = (token, action, resource)
-        if cache_key in self._decision_cache:
-            return self._decision_cache[cache_key]
+        # Key on a fixed-size digest rather than the raw JWT: hashing is done
+        # once, dict probes stop scaling with token length, and the cache no
+        # longer retains secret material.
+        tkey = blake2b(token.encode(), digest_size=16).digest()
+        cache_key = (tkey, action, resource)
+        cached = self._decision_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         user = self._keycloak.resolve_user(token)
         decision = self._evaluate(user=user, action=action, resource=resource)
-        self._decision_cache[cache_key] = decision
+        self._decision_cache.put(cache_key, decision)
         return decision
 
     def _evaluate(
         self, *, user: KeycloakUser, action: str, resource: str
     ) -> PolicyDecision:
         user_roles = user.roles
-        permissions = self._rbac_config.permissions_for_roles(user_roles)
+        permissions = self._rbac_config.permissions_set_for_roles(user_roles)
 
         if action not in permissions:
             return PolicyDecision(
@@ -137,14 +173,20 @@ class RBACEnforcer:
             roles=user_roles,
             action=action,
         )
-        decision = self._policy_engine.evaluate(policy_request)
-        return decision
+        # Fast path: most requests are allowed, and the boolean check skips
+        # violation construction entirely.  Only denials fall through to the
+        # full evaluation to build the denial messages.
+        if self._policy_engine.evaluate_allow(policy_request):
+            return PolicyDecision(allowed=True, violations=())
+        return self._policy_engine.evaluate(policy_request)
 
     def _select_binding(
         self, roles: Sequence[str], action: str, resource: str
     ) -> RBACBinding | None:
-        for binding in self._rbac_config.bindings_for_roles(roles):
-            if action in binding.actions and resource in binding.resources:
+        lookup = self._rbac_config._role_index
+        for role in roles:
+            binding = lookup.get(role)
+            if binding and action in binding.actions and resource in binding.resources:
                 return binding
         return None
 
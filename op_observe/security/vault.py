@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, MutableMapping, Protocol
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Protocol
+
+from ..utils import LRUCache
+from ._json import dumps_sorted
 
 
 class VaultTransport(Protocol):
@@ -33,7 +36,7 @@ class VaultClient:
         self._address = address.rstrip("/")
         self._token = token
         self._transport = transport
-        self._cache: MutableMapping[str, VaultSecret] = {}
+        self._cache: LRUCache = LRUCache(maxsize=1024)
 
     @property
     def address(self) -> str:
@@ -45,41 +48,52 @@ class VaultClient:
         The method normalizes the response from both KV v1 and KV v2 engines.
         """
 
-        if use_cache and path in self._cache:
-            return self._cache[path]
+        if use_cache:
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
 
         raw = self._transport.read_secret(path, token=self._token)
         if not raw:
             raise KeyError(f"Secret at path '{path}' was not found")
 
-        if "data" in raw and isinstance(raw["data"], Mapping):
-            payload = raw["data"]
+        # Single dispatch on the payload shape; the secret wraps read-only
+        # views over the transport's mappings instead of copying them.
+        data_field = raw.get("data")
+        if isinstance(data_field, Mapping):
             metadata = raw.get("metadata", {})
-            if "data" in payload and isinstance(payload["data"], Mapping):
+            inner = data_field.get("data")
+            if isinstance(inner, Mapping):
                 # KV v2 data structure
-                data = dict(payload["data"])
+                data = inner
             else:
-                data = dict(payload)
+                data = data_field
         else:
-            data = dict(raw)
+            data = raw
             metadata = {}
 
-        secret = VaultSecret(path=path, data=data, metadata=dict(metadata))
+        secret = VaultSecret(
+            path=path,
+            data=MappingProxyType(data),
+            metadata=MappingProxyType(metadata),
+        )
         if use_cache:
-            self._cache[path] = secret
+            self._cache.put(path, secret)
         return secret
 
     def dump_cache(self) -> str:
         """Export the cached secrets for diagnostics and policy audits."""
 
+        # Materialise plain dicts: the secrets hold mapping proxies, which
+        # the JSON serialisers reject.
         serialized = {
             path: {
-                "data": secret.data,
-                "metadata": secret.metadata,
+                "data": dict(secret.data),
+                "metadata": dict(secret.metadata),
             }
             for path, secret in self._cache.items()
         }
-        return json.dumps(serialized, sort_keys=True)
+        return dumps_sorted(serialized)
 
 
 class InMemoryVaultTransport:
@@ -5,14 +5,30 @@ collectors and exporting runtime metrics to Prometheus and ClickHouse.
 """
 
 from .collector import build_collector_config
+from .config import UnifiedTelemetryConfig
 from .exporters import ClickHouseExporterConfig, PrometheusExporterConfig
 from .grafana import build_guardrail_dashboard
+from .guardrails import (
+    GuardrailDirection,
+    GuardrailMetrics,
+    GuardrailSeverity,
+    get_guardrail_metrics,
+    record_critic_score,
+    record_guard_failure,
+)
 from .metrics import MetricsRegistry
 
 __all__ = [
     "build_collector_config",
     "ClickHouseExporterConfig",
     "PrometheusExporterConfig",
+    "GuardrailDirection",
+    "GuardrailMetrics",
+    "GuardrailSeverity",
+    "get_guardrail_metrics",
+    "record_critic_score",
+    "record_guard_failure",
     "MetricsRegistry",
+    "UnifiedTelemetryConfig",
     "build_guardrail_dashboard",
 ]
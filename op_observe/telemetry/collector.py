@@ -1,6 +1,7 @@
 """Helpers for building OpenTelemetry collector configuration."""
 from __future__ import annotations
 
+from collections import deque
 from typing import Dict, Iterable, Mapping, MutableMapping
 
 from .exporters import ClickHouseExporterConfig, PrometheusExporterConfig
@@ -13,17 +14,38 @@ DEFAULT_PROCESSORS = {
     },
 }
 
+_DEFAULT_PROCESSOR_NAMES = sorted(DEFAULT_PROCESSORS)
+
+_DEFAULT_RECEIVERS = {
+    "otlp": {
+        "protocols": {
+            "grpc": {},
+            "http": {},
+        }
+    }
+}
+
+_DEFAULT_RECEIVER_NAMES = sorted(_DEFAULT_RECEIVERS)
+
+# Alphabetical, matching what sorted(exporters) used to produce.
+_EXPORTER_NAMES = [
+    ClickHouseExporterConfig.EXPORTER_NAME,
+    PrometheusExporterConfig.EXPORTER_NAME,
+]
+
 
 def _merge_dict(into: MutableMapping[str, object], other: Mapping[str, object]) -> None:
-    for key, value in other.items():
-        if key not in into:
-            into[key] = value
-            continue
-        current = into[key]
-        if isinstance(current, dict) and isinstance(value, Mapping):
-            _merge_dict(current, value)
-        else:
-            into[key] = value
+    # Iterative merge: an explicit stack of (into, other) pairs avoids a
+    # Python frame per nesting level of the exporter config.
+    stack = deque([(into, other)])
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, Mapping):
+                stack.append((current, value))
+            else:
+                target[key] = value
 
 
 def build_collector_config(
@@ -47,25 +69,20 @@ def build_collector_config(
     receiver_block: Dict[str, object]
     if receivers:
         receiver_block = {name: {} for name in receivers}
+        receiver_names = sorted(receiver_block)
     else:
-        receiver_block = {
-            "otlp": {
-                "protocols": {
-                    "grpc": {},
-                    "http": {},
-                }
-            }
-        }
+        receiver_block = _DEFAULT_RECEIVERS
+        receiver_names = _DEFAULT_RECEIVER_NAMES
 
     exporters: Dict[str, object] = {}
-    _merge_dict(exporters, prometheus.otel_exporter())
-    _merge_dict(exporters, clickhouse.otel_exporter())
+    _merge_dict(exporters, prometheus.otel_exporter)
+    _merge_dict(exporters, clickhouse.otel_exporter)
 
     pipelines = {
         "metrics": {
-            "receivers": sorted(receiver_block.keys()),
-            "processors": sorted(DEFAULT_PROCESSORS.keys()),
-            "exporters": sorted(exporters.keys()),
+            "receivers": receiver_names,
+            "processors": _DEFAULT_PROCESSOR_NAMES,
+            "exporters": _EXPORTER_NAMES,
         }
     }
 
@@ -0,0 +1,59 @@
+"""Unified telemetry resource configuration.
+
+One frozen config describes the OpenTelemetry resource shared by spans,
+metrics and logs.  Because the instance is immutable, the merged
+attribute dictionaries are built once and reused on every export.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class UnifiedTelemetryConfig:
+    """Resource identity applied to every exported signal."""
+
+    service_name: str = "op-observe"
+    environment: str = "development"
+    otlp_endpoint: str = "http://localhost:4318"
+    resource_attributes: Mapping[str, str] = field(default_factory=dict)
+
+    @cached_property
+    def _base_attrs(self) -> Dict[str, str]:
+        """Merged resource attributes, built once per instance.
+
+        The dataclass is frozen so the merge can never go stale; per-call
+        work reduces to one dict copy.
+        """
+
+        return {
+            "service.name": self.service_name,
+            "deployment.environment": self.environment,
+            **self.resource_attributes,
+        }
+
+    def resource_attributes_for(
+        self, module: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Resource attributes for one module's exporter."""
+
+        attributes = self._base_attrs.copy()
+        if module:
+            attributes["opobserve.module"] = module
+        return attributes
+
+    @cached_property
+    def _stable_dict(self) -> Dict[str, object]:
+        return {
+            "service_name": self.service_name,
+            "environment": self.environment,
+            "otlp_endpoint": self.otlp_endpoint,
+            "resource_attributes": dict(self.resource_attributes),
+        }
+
+    def into_dict(self) -> Dict[str, object]:
+        """Serialisable view of the configuration."""
+
+        return dict(self._stable_dict)
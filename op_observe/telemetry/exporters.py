@@ -8,6 +8,7 @@ serialised to YAML by downstream tooling.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Mapping, Optional
 
 
@@ -15,6 +16,8 @@ from typing import Dict, Mapping, Optional
 class PrometheusExporterConfig:
     """Configuration for the OpenTelemetry Prometheus exporter."""
 
+    EXPORTER_NAME = "prometheus"
+
     endpoint: str = "0.0.0.0"
     port: int = 9464
     metric_namespace: str = "op_observe"
@@ -25,11 +28,16 @@ class PrometheusExporterConfig:
         }
     )
 
+    @cached_property
     def otel_exporter(self) -> Dict[str, object]:
-        """Return a collector configuration fragment for Prometheus."""
+        """Collector configuration fragment for Prometheus.
+
+        Built once per config instance; the dataclass is frozen so the
+        fragment can never go stale.  Callers must treat it as read-only.
+        """
 
         return {
-            "prometheus": {
+            self.EXPORTER_NAME: {
                 "endpoint": f"{self.endpoint}:{self.port}",
                 "namespace": self.metric_namespace,
                 "controller": dict(self.collectors),
@@ -41,6 +49,8 @@ class PrometheusExporterConfig:
 class ClickHouseExporterConfig:
     """Configuration for exporting metrics to ClickHouse."""
 
+    EXPORTER_NAME = "clickhouse"
+
     endpoint: str = "http://localhost:8123"
     database: str = "otel"
     table: str = "metrics"
@@ -48,8 +58,12 @@ class ClickHouseExporterConfig:
     password: Optional[str] = None
     timeout: str = "10s"
 
+    @cached_property
     def otel_exporter(self) -> Dict[str, object]:
-        """Return a collector configuration fragment for ClickHouse."""
+        """Collector configuration fragment for ClickHouse.
+
+        Built once per config instance, as for the Prometheus fragment.
+        """
 
         exporter = {
             "endpoint": self.endpoint,
@@ -61,4 +75,4 @@ class ClickHouseExporterConfig:
             exporter["username"] = self.username
         if self.password:
             exporter["password"] = self.password
-        return {"clickhouse": exporter}
+        return {self.EXPORTER_NAME: exporter}
@@ -0,0 +1,854 @@
+"""Guardrail metric instruments bridging OpenTelemetry and Prometheus.
+
+Guardrail verdicts and LLM-Critic scores are recorded through whichever
+backends are installed: an OpenTelemetry meter (with the Prometheus reader
+attached when available), a native ``prometheus_client`` collector, and an
+in-memory mirror that keeps totals queryable without any exporter.  All
+optional dependencies degrade to functional in-memory fallbacks.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from bisect import bisect_left
+from enum import Enum
+from itertools import accumulate, product
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..utils import LRUCache
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when opentelemetry is installed
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry.sdk.metrics import MeterProvider as OtelMeterProvider
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None  # type: ignore[assignment]
+    OtelMeterProvider = None  # type: ignore[assignment, misc]
+
+try:  # pragma: no cover - exercised only when the exporter is installed
+    from opentelemetry.exporter.prometheus import PrometheusMetricReader
+except ImportError:  # pragma: no cover - optional dependency
+    PrometheusMetricReader = None  # type: ignore[assignment, misc]
+
+try:  # pragma: no cover - exercised only when prometheus_client is installed
+    from prometheus_client import REGISTRY as PROMETHEUS_DEFAULT_REGISTRY
+    from prometheus_client import Counter as PromCounter
+    from prometheus_client import Histogram as PromHistogram
+except ImportError:  # pragma: no cover - optional dependency
+    PROMETHEUS_DEFAULT_REGISTRY = None  # type: ignore[assignment]
+    PromCounter = None  # type: ignore[assignment, misc]
+    PromHistogram = None  # type: ignore[assignment, misc]
+
+
+# Striped-cell accounting: concurrent recorders update per-thread shards
+# (single list-index increments, atomic under the GIL) instead of fighting
+# over one lock; reads sum the shards.
+_NUM_SHARDS = os.cpu_count() or 4
+
+
+def _shard() -> int:
+    return threading.get_ident() % _NUM_SHARDS
+
+
+def _as_str(value: object) -> str:
+    """Coerce to ``str``, skipping the call when it already is one.
+
+    ``type(value) is str`` is a C-level identity check, so the common
+    all-strings case pays no conversion.
+    """
+
+    return value if type(value) is str else str(value)
+
+
+class GuardrailDirection(str, Enum):
+    """Which side of the model call a guardrail protects."""
+
+    INPUT = "input"
+    OUTPUT = "output"
+
+
+class GuardrailSeverity(str, Enum):
+    """How severe a guardrail failure is."""
+
+    WARNING = "warning"
+    CRITICAL = "critical"
+
+
+# Flat index over the fixed (direction, severity) keyspace.  The lookup
+# key is the concatenation of the two enum values, which are interned
+# string constants, so indexing avoids allocating a tuple per call.
+_GUARD_KEYS: Tuple[Tuple[GuardrailDirection, GuardrailSeverity], ...] = tuple(
+    product(GuardrailDirection, GuardrailSeverity)
+)
+_GUARD_IDX: Dict[str, int] = {
+    direction.value + severity.value: index
+    for index, (direction, severity) in enumerate(_GUARD_KEYS)
+}
+
+
+# In-memory Prometheus-compatible collectors ---------------------------------
+class MemoryCounterChild:
+    """Counter child bound to one label-value tuple."""
+
+    __slots__ = ("_parent", "_label_values")
+
+    def __init__(self, parent: "MemoryCounter", label_values: Tuple[str, ...]):
+        self._parent = parent
+        self._label_values = label_values
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._parent._inc(self._label_values, amount)
+
+
+class MemoryCounter:
+    """Minimal stand-in for ``prometheus_client.Counter``."""
+
+    __slots__ = ("_name", "_documentation", "_labelnames", "_lock", "_values")
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def labels(self, *values: str, **labels: str) -> MemoryCounterChild:
+        if labels:
+            values = tuple(_as_str(labels[name]) for name in self._labelnames)
+        return MemoryCounterChild(self, tuple(_as_str(value) for value in values))
+
+    def _inc(self, label_values: Tuple[str, ...], amount: float) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def collect_values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class _HistState:
+    """Streaming aggregate for one label-set: count, sum and buckets.
+
+    Bucket counts are dense (one slot per boundary, incremented once per
+    observation); readers reconstitute the cumulative le-form with a
+    running sum.
+    """
+
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self, num_buckets: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * num_buckets
+
+
+class MemoryHistogramChild:
+    """Histogram child bound to one label-value tuple."""
+
+    __slots__ = ("_parent", "_label_values")
+
+    def __init__(self, parent: "MemoryHistogram", label_values: Tuple[str, ...]):
+        self._parent = parent
+        self._label_values = label_values
+
+    def observe(self, value: float) -> None:
+        self._parent._observe(self._label_values, value)
+
+
+class MemoryHistogram:
+    """Minimal stand-in for ``prometheus_client.Histogram``.
+
+    Observations stream into per-label aggregates (count, sum and
+    cumulative le-bucket counters) rather than being retained, so memory
+    per label-set is fixed and ``collect_values`` reads the aggregates
+    directly.
+    """
+
+    __slots__ = (
+        "_name", "_documentation", "_labelnames", "_buckets", "_lock", "_values"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = (),
+    ):
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], _HistState] = {}
+
+    def labels(self, *values: str, **labels: str) -> MemoryHistogramChild:
+        if labels:
+            values = tuple(_as_str(labels[name]) for name in self._labelnames)
+        return MemoryHistogramChild(self, tuple(_as_str(value) for value in values))
+
+    def _observe(self, label_values: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            # Not setdefault: its default argument is built eagerly, which
+            # would allocate a throwaway _HistState on every hit.
+            state = self._values.get(label_values)
+            if state is None:
+                state = _HistState(len(self._buckets))
+                self._values[label_values] = state
+            state.count += 1
+            state.total += value
+            # One C-level binary search and one increment; the final
+            # boundary is +Inf, so the index is always in range.
+            state.buckets[bisect_left(self._buckets, value)] += 1
+
+    def collect_values(self) -> Dict[Tuple[str, ...], Dict[str, object]]:
+        with self._lock:
+            return {
+                label_values: {
+                    "count": state.count,
+                    "sum": state.total,
+                    "buckets": dict(
+                        zip(self._buckets, accumulate(state.buckets))
+                    ),
+                }
+                for label_values, state in self._values.items()
+            }
+
+
+# Prometheus wrappers --------------------------------------------------------
+# Collectors memoised per registry and name: rebuilding a GuardrailMetrics
+# (common in tests) reuses them instead of constructing a collector just to
+# have the registry reject the duplicate.  Keyed on the registry object via
+# weak references so entries die with their registry; an id()-based key
+# would leak and could alias a fresh registry onto a dead one's collectors.
+_COLLECTOR_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _existing_collector(registry: Any, name: str) -> Optional[Any]:
+    """Single point of access to prometheus_client's private name index."""
+
+    return registry._names_to_collectors.get(name)
+
+
+def _prom_collector(factory: Any, name: str, registry: Any) -> Any:
+    by_name = _COLLECTOR_CACHE.get(registry)
+    if by_name is None:
+        by_name = _COLLECTOR_CACHE.setdefault(registry, {})
+    metric = by_name.get(name)
+    if metric is None:
+        metric = _existing_collector(registry, name)
+        if metric is None:
+            metric = factory()
+        by_name[name] = metric
+    return metric
+
+
+def _compile_fast_path(
+    label_names: Tuple[str, ...], cache_get: Any, resolve: Any, method: str
+) -> Any:
+    """Generate the schema-specialised record function for a wrapper.
+
+    The label names are inlined as string constants, so each call is one
+    dict probe per label plus one cache probe — no loop over the schema
+    and no kwargs dict.  Misses fall back to ``resolve``, which creates
+    the child under the wrapper's lock.
+    """
+
+    env = {"_get": cache_get, "_resolve": resolve}
+    fetches = ", ".join(f"labels[{name!r}]" for name in label_names)
+    lines = [
+        "def _fast(labels, value):",
+        f"    key = ({fetches},)",
+        "    child = _get(key)",
+        "    if child is None:",
+        "        child = _resolve(key)",
+        f"    child.{method}(value)",
+    ]
+    exec(compile("\n".join(lines), "<metric>", "exec"), env)
+    return env["_fast"]
+
+
+class _CounterWrapper:
+    """Labelled counter over prometheus_client or the in-memory fallback."""
+
+    __slots__ = ("_name", "_labels", "_lock", "_child_cache", "_metric", "_fast_inc")
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...],
+        registry: Optional[Any] = None,
+    ):
+        self._name = name
+        self._labels = tuple(label_names)
+        # Children are cached per label tuple; the lock only guards their
+        # one-time creation, never the increment path.
+        self._lock = threading.Lock()
+        self._child_cache: Dict[Tuple[str, ...], Any] = {}
+        if PromCounter is not None:
+            registry = registry or PROMETHEUS_DEFAULT_REGISTRY
+            self._metric = _prom_collector(
+                lambda: PromCounter(
+                    name, documentation, labelnames=self._labels, registry=registry
+                ),
+                name,
+                registry,
+            )
+        else:
+            self._metric = MemoryCounter(name, documentation, self._labels)
+        self._fast_inc = _compile_fast_path(
+            self._labels, self._child_cache.get, self._child, "inc"
+        )
+
+    def _child(self, ordered: Tuple[str, ...]) -> Any:
+        child = self._child_cache.get(ordered)
+        if child is None:
+            with self._lock:
+                child = self._child_cache.get(ordered)
+                if child is None:
+                    child = self._metric.labels(*ordered)
+                    self._child_cache[ordered] = child
+        return child
+
+    def inc(self, labels: Mapping[str, str], amount: float = 1.0) -> None:
+        self._fast_inc(labels, amount)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        """Per-label totals, read from the backing collector."""
+
+        metric = self._metric
+        if isinstance(metric, MemoryCounter):
+            return metric.collect_values()
+        totals: Dict[Tuple[str, ...], float] = {}
+        for family in metric.collect():
+            for sample in family.samples:
+                if sample.name.endswith("_total"):
+                    key = tuple(sample.labels[name] for name in self._labels)
+                    totals[key] = sample.value
+        return totals
+
+
+class _HistogramWrapper:
+    """Labelled histogram over prometheus_client or the in-memory fallback.
+
+    The in-memory backend maintains streaming per-label aggregates —
+    count, sum and cumulative le-bucket counters — updated on every
+    observe, so ``snapshot`` never rescans raw samples.
+    """
+
+    __slots__ = (
+        "_name", "_labels", "_buckets", "_lock", "_child_cache", "_metric",
+        "_fast_observe",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...],
+        buckets: Tuple[float, ...],
+        registry: Optional[Any] = None,
+    ):
+        self._name = name
+        self._labels = tuple(label_names)
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._child_cache: Dict[Tuple[str, ...], Any] = {}
+        if PromHistogram is not None:
+            registry = registry or PROMETHEUS_DEFAULT_REGISTRY
+            self._metric = _prom_collector(
+                lambda: PromHistogram(
+                    name,
+                    documentation,
+                    labelnames=self._labels,
+                    buckets=self._buckets,
+                    registry=registry,
+                ),
+                name,
+                registry,
+            )
+        else:
+            self._metric = MemoryHistogram(
+                name, documentation, self._labels, self._buckets
+            )
+        self._fast_observe = _compile_fast_path(
+            self._labels, self._child_cache.get, self._child, "observe"
+        )
+
+    def _child(self, ordered: Tuple[str, ...]) -> Any:
+        child = self._child_cache.get(ordered)
+        if child is None:
+            with self._lock:
+                child = self._child_cache.get(ordered)
+                if child is None:
+                    child = self._metric.labels(*ordered)
+                    self._child_cache[ordered] = child
+        return child
+
+    def observe(self, labels: Mapping[str, str], value: float) -> None:
+        self._fast_observe(labels, value)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Dict[str, object]]:
+        """Per-label aggregates, read from the backing collector."""
+
+        metric = self._metric
+        if isinstance(metric, MemoryHistogram):
+            return metric.collect_values()
+        aggregates: Dict[Tuple[str, ...], Dict[str, object]] = {}
+        for family in metric.collect():
+            for sample in family.samples:
+                labels = dict(sample.labels)
+                bound = labels.pop("le", None)
+                key = tuple(labels[name] for name in self._labels)
+                state = aggregates.setdefault(
+                    key, {"count": 0, "sum": 0.0, "buckets": {}}
+                )
+                if sample.name.endswith("_bucket"):
+                    state["buckets"][float(bound)] = int(sample.value)
+                elif sample.name.endswith("_sum"):
+                    state["sum"] = sample.value
+                elif sample.name.endswith("_count"):
+                    state["count"] = int(sample.value)
+        return aggregates
+
+
+# OpenTelemetry fallbacks ----------------------------------------------------
+_EMPTY_ATTRS: Mapping[str, str] = MappingProxyType({})
+
+
+def _noop(*_args: Any, **_kwargs: Any) -> None:
+    """Sink for whichever backend the configuration makes redundant."""
+
+
+def _record_attrs(attributes: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+    """Attrs mapping safe to retain: shared proxies as-is, others copied."""
+
+    if attributes is None:
+        return _EMPTY_ATTRS
+    if isinstance(attributes, MappingProxyType):
+        return attributes
+    return dict(attributes)
+
+
+class _FallbackCounterInstrument:
+    """Counter instrument used when the OpenTelemetry SDK is missing.
+
+    Writes append to per-thread shards without locking — ``list.append``
+    is atomic under the GIL — and only readers take the lock to merge.
+    """
+
+    __slots__ = ("_name", "_description", "_lock", "_shards")
+
+    def __init__(self, name: str, description: str = ""):
+        self._name = name
+        self._description = description
+        self._lock = threading.Lock()
+        self._shards: List[List[Tuple[float, Mapping[str, str]]]] = [
+            [] for _ in range(_NUM_SHARDS)
+        ]
+
+    def add(self, amount: float, attributes: Optional[Mapping[str, str]] = None) -> None:
+        self._shards[_shard()].append((amount, _record_attrs(attributes)))
+
+    def iter_records(self) -> List[Tuple[float, Mapping[str, str]]]:
+        with self._lock:
+            records: List[Tuple[float, Mapping[str, str]]] = []
+            for shard in self._shards:
+                records.extend(shard)
+            return records
+
+
+class _FallbackHistogramInstrument:
+    """Histogram instrument used when the OpenTelemetry SDK is missing.
+
+    Same sharded write path as :class:`_FallbackCounterInstrument`.
+    """
+
+    __slots__ = ("_name", "_description", "_lock", "_shards")
+
+    def __init__(self, name: str, description: str = ""):
+        self._name = name
+        self._description = description
+        self._lock = threading.Lock()
+        self._shards: List[List[Tuple[float, Mapping[str, str]]]] = [
+            [] for _ in range(_NUM_SHARDS)
+        ]
+
+    def record(self, value: float, attributes: Optional[Mapping[str, str]] = None) -> None:
+        self._shards[_shard()].append((value, _record_attrs(attributes)))
+
+    def iter_records(self) -> List[Tuple[float, Mapping[str, str]]]:
+        with self._lock:
+            records: List[Tuple[float, Mapping[str, str]]] = []
+            for shard in self._shards:
+                records.extend(shard)
+            return records
+
+
+class _FallbackMeter:
+    """Meter handing out fallback instruments, memoised by name."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._lock = threading.Lock()
+        self._counters: Dict[str, _FallbackCounterInstrument] = {}
+        self._histograms: Dict[str, _FallbackHistogramInstrument] = {}
+
+    def create_counter(self, name: str, **kwargs: Any) -> _FallbackCounterInstrument:
+        # Double-checked: dict reads are atomic under the GIL, so repeat
+        # lookups skip the lock and only a miss pays for it.
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = _FallbackCounterInstrument(
+                        name, kwargs.get("description", "")
+                    )
+                    self._counters[name] = counter
+        return counter
+
+    def create_histogram(self, name: str, **kwargs: Any) -> _FallbackHistogramInstrument:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = _FallbackHistogramInstrument(
+                        name, kwargs.get("description", "")
+                    )
+                    self._histograms[name] = histogram
+        return histogram
+
+
+class _FallbackMeterProvider:
+    """Meter provider used when the OpenTelemetry SDK is missing."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._meters: Dict[str, _FallbackMeter] = {}
+
+    def get_meter(self, name: str, *args: Any, **kwargs: Any) -> _FallbackMeter:
+        meter = self._meters.get(name)
+        if meter is None:
+            with self._lock:
+                meter = self._meters.get(name)
+                if meter is None:
+                    meter = _FallbackMeter(name)
+                    self._meters[name] = meter
+        return meter
+
+
+def _create_meter_provider() -> Any:
+    """Build the process-wide meter provider, preferring the real SDK."""
+
+    if OtelMeterProvider is not None and PrometheusMetricReader is not None:
+        reader = PrometheusMetricReader()
+        provider = OtelMeterProvider(metric_readers=[reader])
+        otel_metrics.set_meter_provider(provider)
+        return provider
+    return _FallbackMeterProvider()
+
+
+# Built lazily: importing this module must not allocate SDK state (or
+# mutate the global meter provider) in processes that never record.
+_METER_PROVIDER: Optional[Any] = None
+_METER_PROVIDER_LOCK = threading.Lock()
+
+
+def _get_meter_provider() -> Any:
+    global _METER_PROVIDER
+    provider = _METER_PROVIDER
+    if provider is None:
+        with _METER_PROVIDER_LOCK:
+            provider = _METER_PROVIDER
+            if provider is None:
+                provider = _METER_PROVIDER = _create_meter_provider()
+    return provider
+
+
+class GuardrailMetrics:
+    """Record guardrail failures and LLM-Critic scores across backends."""
+
+    # Already sorted, de-duplicated and +Inf-terminated, so the default
+    # path uses it verbatim; only caller-supplied buckets are normalised.
+    _DEFAULT_BUCKETS = (0.0, 0.25, 0.5, 0.75, 0.9, 0.95, 1.0, float("inf"))
+
+    def __init__(
+        self,
+        *,
+        provider: Optional[Any] = None,
+        registry: Optional[Any] = None,
+        buckets: Optional[Tuple[float, ...]] = None,
+    ) -> None:
+        if buckets is None:
+            boundaries = self._DEFAULT_BUCKETS
+        else:
+            boundaries = tuple(sorted(set(buckets)))
+            if boundaries[-1] != float("inf"):
+                boundaries = boundaries + (float("inf"),)
+        self._bucket_boundaries = boundaries
+
+        provider = provider or _get_meter_provider()
+        meter = provider.get_meter("op_observe.guardrails")
+        # One backend is authoritative per configuration: with the real
+        # SDK the Prometheus reader already exports every OTel write, so
+        # the shadow prometheus_client writes are redundant; without the
+        # SDK the fallback instruments are the redundant mirror and the
+        # Prometheus wrappers carry the data.
+        otel_active = not isinstance(meter, _FallbackMeter)
+        self._otel_has_prometheus = (
+            otel_active and PrometheusMetricReader is not None
+        )
+        self._guard_counter = meter.create_counter(
+            "guardrail_failures",
+            description="Count of guardrail failures by direction and severity",
+        )
+        self._critic_histogram = meter.create_histogram(
+            "llm_critic_score",
+            description="Distribution of LLM-Critic scores",
+        )
+        self._prom_counter = _CounterWrapper(
+            "guardrail_failures_total",
+            "Count of guardrail failures by direction and severity",
+            ("direction", "severity"),
+            registry=registry,
+        )
+        self._prom_histogram = _HistogramWrapper(
+            "llm_critic_score",
+            "Distribution of LLM-Critic scores",
+            ("verdict",),
+            boundaries,
+            registry=registry,
+        )
+        # Bound once per configuration so the record paths call the
+        # authoritative backends without per-call branching.
+        if otel_active:
+            self._otel_add = self._guard_counter.add
+            self._otel_record = self._critic_histogram.record
+        else:
+            self._otel_add = _noop
+            self._otel_record = _noop
+        if self._otel_has_prometheus:
+            self._prom_inc = _noop
+            self._prom_observe = _noop
+        else:
+            self._prom_inc = self._prom_counter.inc
+            self._prom_observe = self._prom_histogram.observe
+        # Fast-path cache over the fixed keyspace: the OTel attrs dict and
+        # resolved Prometheus child-increment per (direction, severity), so
+        # recording without extra attributes allocates nothing.
+        self._guard_attr_cache: Dict[
+            Tuple[GuardrailDirection, GuardrailSeverity],
+            Tuple[Mapping[str, str], Any],
+        ] = {}
+        for direction in GuardrailDirection:
+            for severity in GuardrailSeverity:
+                # Frozen: the same mapping is handed to the backends on
+                # every call, so it must be immutable.
+                attrs = MappingProxyType(
+                    {"direction": direction.value, "severity": severity.value}
+                )
+                if self._otel_has_prometheus:
+                    child_inc = _noop
+                else:
+                    child_inc = self._prom_counter._child(
+                        (direction.value, severity.value)
+                    ).inc
+                self._guard_attr_cache[(direction, severity)] = (attrs, child_inc)
+        # Verdicts form a small open set; cache their frozen attrs dicts.
+        self._critic_attr_cache: LRUCache = LRUCache(maxsize=32)
+        # Lock-free striped state: the keyspace is fixed (4 combinations),
+        # so the cells are preallocated flat per shard and the hot path is
+        # one string-keyed index probe plus one cell increment.
+        self._guard_cells: List[List[int]] = [
+            [0] * len(_GUARD_KEYS) for _ in range(_NUM_SHARDS)
+        ]
+        self._critic_count_cells = [0] * _NUM_SHARDS
+        self._critic_sum_cells = [0.0] * _NUM_SHARDS
+        self._critic_bucket_cells = [
+            [0] * len(boundaries) for _ in range(_NUM_SHARDS)
+        ]
+        # Built once so batched recording can searchsorted without
+        # re-converting the boundaries per call.
+        self._bucket_boundaries_arr = (
+            None if _np is None else _np.asarray(boundaries, dtype=_np.float64)
+        )
+
+    # Recording helpers -------------------------------------------------
+    def record_guard_failure(
+        self,
+        direction: GuardrailDirection,
+        severity: GuardrailSeverity,
+        attributes: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        if attributes is None:
+            attrs, child_inc = self._guard_attr_cache[(direction, severity)]
+            self._otel_add(1, attrs)
+            child_inc(1)
+        else:
+            attrs = {"direction": direction.value, "severity": severity.value}
+            attrs.update({k: _as_str(v) for k, v in attributes.items()})
+            self._otel_add(1, attrs)
+            self._prom_inc(
+                {"direction": attrs["direction"], "severity": attrs["severity"]}
+            )
+        self._guard_cells[_shard()][
+            _GUARD_IDX[direction.value + severity.value]
+        ] += 1
+
+    def record_critic_score(
+        self,
+        score: float,
+        verdict: str = "unknown",
+        attributes: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        score = float(score)
+        attrs = self._critic_attrs(verdict, attributes)
+        self._otel_record(score, attrs)
+        self._prom_observe(attrs, score)
+        shard = _shard()
+        self._critic_count_cells[shard] += 1
+        self._critic_sum_cells[shard] += score
+        # Dense per-shard bucket cells: one bisect, one increment.
+        self._critic_bucket_cells[shard][
+            bisect_left(self._bucket_boundaries, score)
+        ] += 1
+
+    def record_critic_scores(
+        self,
+        scores: Iterable[float],
+        *,
+        verdict: str = "unknown",
+        attributes: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        """Record a batch of critic scores in one pass.
+
+        Bucket assignment is vectorised through numpy when it is
+        installed (one ``searchsorted`` plus one ``bincount`` for the
+        whole batch); the striped aggregates are folded in once per
+        batch instead of once per score.
+        """
+
+        if _np is not None:
+            arr = _np.asarray(
+                scores if isinstance(scores, (list, tuple)) else list(scores),
+                dtype=_np.float64,
+            )
+            if arr.size == 0:
+                return
+            indexes = _np.searchsorted(
+                self._bucket_boundaries_arr, arr, side="left"
+            )
+            counts = _np.bincount(
+                indexes, minlength=len(self._bucket_boundaries)
+            ).tolist()
+            values = arr.tolist()
+            batch_sum = float(arr.sum())
+        else:
+            values = [float(score) for score in scores]
+            if not values:
+                return
+            boundaries = self._bucket_boundaries
+            counts = [0] * len(boundaries)
+            for value in values:
+                counts[bisect_left(boundaries, value)] += 1
+            batch_sum = sum(values)
+        attrs = self._critic_attrs(verdict, attributes)
+        record = self._otel_record
+        observe = self._prom_observe
+        for value in values:
+            record(value, attrs)
+            observe(attrs, value)
+        shard = _shard()
+        self._critic_count_cells[shard] += len(values)
+        self._critic_sum_cells[shard] += batch_sum
+        cells = self._critic_bucket_cells[shard]
+        for index, count in enumerate(counts):
+            if count:
+                cells[index] += count
+
+    def _critic_attrs(
+        self, verdict: str, attributes: Optional[Mapping[str, object]]
+    ) -> Mapping[str, str]:
+        if attributes is None:
+            attrs = self._critic_attr_cache.get(verdict)
+            if attrs is None:
+                attrs = MappingProxyType({"verdict": _as_str(verdict)})
+                self._critic_attr_cache.put(verdict, attrs)
+            return attrs
+        attrs = {"verdict": _as_str(verdict)}
+        attrs.update({k: _as_str(v) for k, v in attributes.items()})
+        return attrs
+
+    # Read helpers ------------------------------------------------------
+    def guard_failure_totals(
+        self,
+    ) -> Dict[Tuple[GuardrailDirection, GuardrailSeverity], int]:
+        return {
+            key: sum(cells[index] for cells in self._guard_cells)
+            for index, key in enumerate(_GUARD_KEYS)
+        }
+
+    def critic_score_summary(self) -> Dict[str, object]:
+        bucket_totals = [
+            sum(cells[index] for cells in self._critic_bucket_cells)
+            for index in range(len(self._bucket_boundaries))
+        ]
+        return {
+            "count": sum(self._critic_count_cells),
+            "sum": sum(self._critic_sum_cells),
+            "buckets": dict(
+                zip(self._bucket_boundaries, accumulate(bucket_totals))
+            ),
+        }
+
+
+_default_metrics: Optional[GuardrailMetrics] = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_guardrail_metrics() -> GuardrailMetrics:
+    """Return the process-wide :class:`GuardrailMetrics` instance.
+
+    Built on first use so importing the module stays free of metric
+    setup.
+    """
+
+    global _default_metrics
+    metrics = _default_metrics
+    if metrics is None:
+        with _default_metrics_lock:
+            metrics = _default_metrics
+            if metrics is None:
+                metrics = _default_metrics = GuardrailMetrics()
+    return metrics
+
+
+def record_guard_failure(
+    direction: GuardrailDirection,
+    severity: GuardrailSeverity,
+    attributes: Optional[Mapping[str, object]] = None,
+) -> None:
+    """Record a guardrail failure on the default metrics instance."""
+
+    get_guardrail_metrics().record_guard_failure(direction, severity, attributes)
+
+
+def record_critic_score(
+    score: float,
+    verdict: str = "unknown",
+    attributes: Optional[Mapping[str, object]] = None,
+) -> None:
+    """Record an LLM-Critic score on the default metrics instance."""
+
+    get_guardrail_metrics().record_critic_score(score, verdict, attributes)
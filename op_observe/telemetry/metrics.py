@@ -1,9 +1,50 @@
 """In-memory metrics registry for Prometheus and ClickHouse exports."""
 from __future__ import annotations
 
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Tuple
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Sequence, Tuple
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - exercised only when numba is installed
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - optional dependency
+    _njit = None  # type: ignore[assignment]
+
+
+if _np is not None and _njit is not None:  # pragma: no cover - optional path
+
+    @_njit(cache=True)
+    def _batch_observe_kernel(bounds, batch, out):
+        """Classify a batch into bucket counts and return its sum, in native code."""
+
+        total = 0.0
+        for value in batch:
+            lo = 0
+            hi = bounds.size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if bounds[mid] < value:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            out[lo] += 1
+            total += value
+        return total
+
+else:
+    _batch_observe_kernel = None
 
 
 LabelValues = Tuple[str, ...]
@@ -14,71 +55,412 @@ class MetricError(ValueError):
     """Raised when metric labels are misconfigured."""
 
 
-@dataclass
+def _label_record(items: Iterable[Tuple[str, str]]) -> Mapping[str, str]:
+    """Read-only label mapping with interned values.
+
+    Interning collapses repeated label values (verdicts, stages, ...) to a
+    single string object across keys, and the proxy makes accidental
+    mutation of the shared record impossible.
+    """
+
+    return MappingProxyType({key: sys.intern(value) for key, value in items})
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    formatted = ",".join(
+        f"{key}=\"{value}\"" for key, value in sorted(labels.items())
+    )
+    return f"{{{formatted}}}"
+
+
+class _ColumnarStore:
+    """Structure-of-arrays backing store for one metric.
+
+    Each label-value tuple is assigned a row index once; per-row data then
+    lives in parallel columns (a packed ``array`` of values plus a list of
+    label records), so hot-path updates are a dict probe and an indexed
+    write, and exports walk contiguous columns instead of probing dicts
+    per key.  The ``array`` module grows geometrically on append, so no
+    explicit doubling is needed.
+    """
+
+    __slots__ = ("key_index", "keys", "values", "label_records")
+
+    def __init__(self, typecode: str = "d") -> None:
+        self.key_index: Dict[LabelValues, int] = {}
+        self.keys: List[LabelValues] = []
+        self.values = array(typecode)
+        self.label_records: List[Mapping[str, str]] = []
+
+    def promote(self) -> None:
+        """Widen the value column to float64 in place."""
+
+        if self.values.typecode != "d":
+            self.values = array("d", self.values)
+
+    def add(self, key: LabelValues, record: Mapping[str, str]) -> int:
+        index = len(self.keys)
+        self.key_index[key] = index
+        self.keys.append(key)
+        self.label_records.append(record)
+        # Plain 0 coerces cleanly into both the int64 and float64 columns.
+        self.values.append(0)
+        return index
+
+
+@dataclass(slots=True)
 class _MetricBase:
     name: str
     description: str
     label_names: Tuple[str, ...] = ()
+    # Derived state filled in by __post_init__; declared as fields so the
+    # slotted layout has room for them.
+    _label_names_fset: frozenset = field(init=False, repr=False)
+    _n: int = field(init=False, repr=False)
+    _label_order: Tuple[int, ...] = field(init=False, repr=False)
+    _header_lines: Tuple[str, ...] = field(init=False, repr=False)
+    _name_bytes: bytes = field(init=False, repr=False)
+    _header_bytes: bytes = field(init=False, repr=False)
+    _label_str_cache: Dict[LabelValues, str] = field(init=False, repr=False)
+    _label_bytes_cache: Dict[LabelValues, bytes] = field(init=False, repr=False)
+    _store: _ColumnarStore = field(init=False, repr=False)
+    _sorted_keys: List[int] | None = field(init=False, repr=False)
+
+    _KIND = "untyped"
+    # Typecode of the value column; counters narrow this to int64.
+    _VALUE_TYPECODE = "d"
+
+    def __post_init__(self) -> None:
+        self.label_names = tuple(sys.intern(name) for name in self.label_names)
+        self._label_names_fset = frozenset(self.label_names)
+        self._n = len(self.label_names)
+        # Emission order decided once: positions into the key tuple sorted
+        # by label name, so formatting never re-sorts per emit.
+        self._label_order = tuple(
+            sorted(range(self._n), key=self.label_names.__getitem__)
+        )
+        self._header_lines = (
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self._KIND}",
+        )
+        # Pre-encoded fragments for the bytes serialisation path.
+        self._name_bytes = self.name.encode()
+        self._header_bytes = "\n".join(self._header_lines).encode() + b"\n"
+        self._label_str_cache: Dict[LabelValues, str] = {}
+        self._label_bytes_cache: Dict[LabelValues, bytes] = {}
+        self._store = _ColumnarStore(self._VALUE_TYPECODE)
+        # Row indices in key-sorted order; dropped whenever a new row is
+        # added so scrapes only re-sort after cardinality actually changes.
+        self._sorted_keys: List[int] | None = None
+
+    def _label_parts(self, key: LabelValues) -> List[str]:
+        """``name="value"`` fragments for ``key`` in the precomputed order."""
+
+        names = self.label_names
+        return [f"{names[i]}=\"{key[i]}\"" for i in self._label_order]
+
+    def _label_str(self, key: LabelValues) -> str:
+        """Formatted label string for ``key``, cached per label tuple."""
+
+        cached = self._label_str_cache.get(key)
+        if cached is None:
+            parts = self._label_parts(key)
+            cached = f"{{{','.join(parts)}}}" if parts else ""
+            self._label_str_cache[key] = cached
+        return cached
+
+    def _label_bytes(self, key: LabelValues) -> bytes:
+        cached = self._label_bytes_cache.get(key)
+        if cached is None:
+            cached = self._label_str(key).encode()
+            self._label_bytes_cache[key] = cached
+        return cached
 
     def _key(self, labels: Mapping[str, str]) -> LabelValues:
-        if set(labels) != set(self.label_names):
-            missing = set(self.label_names) - set(labels)
-            extra = set(labels) - set(self.label_names)
-            problems: List[str] = []
-            if missing:
-                problems.append(f"missing labels: {sorted(missing)}")
-            if extra:
-                problems.append(f"unexpected labels: {sorted(extra)}")
+        # Happy path: one length check and one subset probe; the diff sets
+        # for diagnostics are only built in the cold error branch.
+        if len(labels) != self._n or not self._label_names_fset.issubset(labels):
+            self._raise_label_error(labels)
+        return tuple(labels[name] for name in self.label_names)
+
+    def _raise_label_error(self, labels: Mapping[str, str]) -> None:
+        missing = self._label_names_fset - set(labels)
+        extra = set(labels) - self._label_names_fset
+        problems: List[str] = []
+        if missing:
+            problems.append(f"missing labels: {sorted(missing)}")
+        if extra:
+            problems.append(f"unexpected labels: {sorted(extra)}")
+        raise MetricError(
+            f"labels for metric '{self.name}' invalid ({', '.join(problems)})"
+        )
+
+    def _bind(self, values: Tuple[str, ...]) -> LabelValues:
+        """Validate positional label values once."""
+
+        if len(values) != len(self.label_names):
             raise MetricError(
-                f"labels for metric '{self.name}' invalid ({', '.join(problems)})"
+                f"metric '{self.name}' expects {len(self.label_names)} label "
+                f"values, got {len(values)}"
             )
-        return tuple(labels[name] for name in self.label_names)
+        return values
+
+    def _slot(self, key: LabelValues) -> int:
+        """Row index for ``key``, allocating columns on first sight.
+
+        Steady state is a single dict probe; only the first sighting of a
+        key builds and registers its interned read-only label record.
+        """
+
+        store = self._store
+        index = store.key_index.get(key)
+        if index is None:
+            record = self.label_cache.get(key)
+            if record is None:
+                record = self.label_cache[key] = _label_record(
+                    zip(self.label_names, key)
+                )
+            index = store.add(key, record)
+            self._sorted_keys = None
+            self._new_row(index)
+        return index
+
+    def _new_row(self, index: int) -> None:
+        """Hook for subclasses that keep extra columns per row."""
+
+
+class _BoundCounter:
+    """Counter handle pre-bound to one row of the columnar store."""
+
+    __slots__ = ("_metric", "_index")
+
+    def __init__(self, metric: "CounterMetric", key: LabelValues) -> None:
+        self._metric = metric
+        self._index = metric._slot(key)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._add(self._index, amount)
+
+
+class _BoundGauge:
+    """Gauge handle pre-bound to one row of the columnar store."""
+
+    __slots__ = ("_metric", "_index")
+
+    def __init__(self, metric: "GaugeMetric", key: LabelValues) -> None:
+        self._metric = metric
+        self._index = metric._slot(key)
+
+    def set(self, value: float) -> None:
+        self._metric._store.values[self._index] = value
+
 
+class _BoundHistogram:
+    """Histogram handle pre-bound to one row of the columnar store."""
 
-@dataclass
+    __slots__ = ("_metric", "_index")
+
+    def __init__(self, metric: "HistogramMetric", key: LabelValues) -> None:
+        self._metric = metric
+        self._index = metric._slot(key)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._index, value)
+
+
+@dataclass(slots=True)
 class CounterMetric(_MetricBase):
-    values: MutableMapping[LabelValues, float] = field(default_factory=dict)
     label_cache: MutableMapping[LabelValues, LabelDict] = field(default_factory=dict)
 
+    _KIND = "counter"
+    # Counters are overwhelmingly incremented by whole weights, so the
+    # value column starts as int64 (half the conversion churn, exact
+    # arithmetic) and is widened to float64 on the first fractional
+    # increment.
+    _VALUE_TYPECODE = "q"
+
+    def labels(self, *values: str) -> _BoundCounter:
+        key = self._bind(values)
+        return _BoundCounter(self, key)
+
     def inc(self, amount: float = 1.0, **labels: str) -> None:
-        key = self._key(labels)
-        self.values[key] = self.values.get(key, 0.0) + amount
-        if key not in self.label_cache:
-            self.label_cache[key] = dict(labels)
+        self._add(self._slot(self._key(labels)), amount)
 
+    def _add(self, index: int, amount: float) -> None:
+        """Increment one row: a single indexed ``+=``, no missing-key branch."""
 
-@dataclass
+        store = self._store
+        values = store.values
+        if values.typecode == "q":
+            whole = int(amount)
+            if whole == amount:
+                values[index] += whole
+                return
+            store.promote()
+            values = store.values
+        values[index] += amount
+
+
+@dataclass(slots=True)
 class GaugeMetric(_MetricBase):
-    values: MutableMapping[LabelValues, float] = field(default_factory=dict)
     label_cache: MutableMapping[LabelValues, LabelDict] = field(default_factory=dict)
 
+    _KIND = "gauge"
+
+    def labels(self, *values: str) -> _BoundGauge:
+        key = self._bind(values)
+        return _BoundGauge(self, key)
+
     def set(self, value: float, **labels: str) -> None:
-        key = self._key(labels)
-        self.values[key] = value
-        self.label_cache[key] = dict(labels)
+        self._store.values[self._slot(self._key(labels))] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class HistogramMetric(_MetricBase):
+    """Histogram storing per-bucket counters plus running sum and count.
+
+    Observations are aggregated on the fly rather than retained, so memory
+    per label-set is fixed and exports read the aggregates directly.  All
+    per-row state lives in packed ``array`` columns (int64 bucket counts
+    and observation totals, float64 sums) rather than lists of boxed
+    floats.
+    """
+
     buckets: Tuple[float, ...] = (50, 100, 200, 500, 1000)
-    samples: MutableMapping[LabelValues, List[float]] = field(default_factory=dict)
     label_cache: MutableMapping[LabelValues, LabelDict] = field(default_factory=dict)
+    _bucket_strs: Tuple[str, ...] = field(init=False, repr=False)
+    _bucket_label_cache: Dict[LabelValues, List[str]] = field(init=False, repr=False)
+    _bucket_bytes_cache: Dict[LabelValues, List[bytes]] = field(init=False, repr=False)
+    _buckets_np: object = field(init=False, repr=False)
+    _le_pos: int = field(init=False, repr=False)
+    _bucket_columns: List["array[int]"] = field(init=False, repr=False)
+    _sums: "array[float]" = field(init=False, repr=False)
+    _counts_total: "array[int]" = field(init=False, repr=False)
+
+    _KIND = "histogram"
+
+    def __post_init__(self) -> None:
+        # Explicit base call: slots=True rebuilds the class, which breaks
+        # the zero-argument super() form inside dataclass methods.
+        _MetricBase.__post_init__(self)
+        # Bound labels as strings, computed once; the final entry is the
+        # +Inf overflow bucket.
+        self._bucket_strs = tuple(str(bound) for bound in self.buckets) + ("+Inf",)
+        self._bucket_label_cache: Dict[LabelValues, List[str]] = {}
+        self._bucket_bytes_cache: Dict[LabelValues, List[bytes]] = {}
+        self._buckets_np = (
+            _np.asarray(self.buckets, dtype=_np.float64) if _np is not None else None
+        )
+        # Splice position of the le="..." fragment within the pre-sorted
+        # label fragments, decided once at construction.
+        self._le_pos = bisect_left(
+            [self.label_names[i] for i in self._label_order], "le"
+        )
+        # Histogram columns parallel to the store rows: per-row bucket
+        # counters plus running sum and observation count.
+        self._bucket_columns: List["array[int]"] = []
+        self._sums = array("d")
+        self._counts_total = array("q")
+
+    def _new_row(self, index: int) -> None:
+        # One slot per bucket plus the +Inf overflow slot.
+        self._bucket_columns.append(array("q", bytes(8 * (len(self.buckets) + 1))))
+        self._sums.append(0.0)
+        self._counts_total.append(0)
+
+    def _bucket_label_strs(self, key: LabelValues) -> List[str]:
+        """Per-bucket label strings (with le=...) for ``key``, cached."""
+
+        cached = self._bucket_label_cache.get(key)
+        if cached is None:
+            parts = self._label_parts(key)
+            le_pos = self._le_pos
+            cached = []
+            for bound_str in self._bucket_strs:
+                spliced = parts[:le_pos] + [f'le="{bound_str}"'] + parts[le_pos:]
+                cached.append(f"{{{','.join(spliced)}}}")
+            self._bucket_label_cache[key] = cached
+        return cached
+
+    def _bucket_label_bytes(self, key: LabelValues) -> List[bytes]:
+        cached = self._bucket_bytes_cache.get(key)
+        if cached is None:
+            cached = [label.encode() for label in self._bucket_label_strs(key)]
+            self._bucket_bytes_cache[key] = cached
+        return cached
+
+    def labels(self, *values: str) -> _BoundHistogram:
+        key = self._bind(values)
+        return _BoundHistogram(self, key)
+
+    def _observe(self, index: int, value: float) -> None:
+        # O(log B) bucket search; bisect_left on the sorted bounds lands on
+        # the first bucket with bound >= value (le semantics), and an index
+        # past the last bound is exactly the +Inf slot.
+        self._bucket_columns[index][bisect_left(self.buckets, value)] += 1
+        self._sums[index] += value
+        self._counts_total[index] += 1
 
     def observe(self, value: float, **labels: str) -> None:
-        key = self._key(labels)
-        self.samples.setdefault(key, []).append(value)
-        if key not in self.label_cache:
-            self.label_cache[key] = dict(labels)
-
-    def iter_statistics(self) -> Iterable[Tuple[LabelDict, List[float]]]:
-        for key, values in self.samples.items():
-            labels = self.label_cache.get(key, {})
-            yield labels, values
+        self._observe(self._slot(self._key(labels)), value)
+
+    def observe_many(self, values: Sequence[float], **labels: str) -> None:
+        """Record a batch of observations in one pass.
+
+        With numpy installed the whole batch is classified by a single
+        searchsorted/bincount pair; otherwise it falls back to the scalar
+        bisect loop.
+        """
+
+        index = self._slot(self._key(labels))
+        counts = self._bucket_columns[index]
+        if _np is not None:
+            batch = _np.asarray(values, dtype=_np.float64)
+            if _batch_observe_kernel is not None:
+                batch_counts = _np.zeros(len(counts), dtype=_np.int64)
+                total = _batch_observe_kernel(
+                    self._buckets_np, batch, batch_counts
+                )
+            else:
+                # side="left" matches bisect_left, i.e. the le bucket bounds.
+                indexes = _np.searchsorted(self._buckets_np, batch, side="left")
+                batch_counts = _np.bincount(indexes, minlength=len(counts))
+                total = float(batch.sum())
+            for slot, bucket_count in enumerate(batch_counts):
+                counts[slot] += int(bucket_count)
+            self._sums[index] += float(total)
+            self._counts_total[index] += int(batch.size)
+        else:
+            buckets = self.buckets
+            total = 0.0
+            for value in values:
+                counts[bisect_left(buckets, value)] += 1
+                total += value
+            self._sums[index] += total
+            self._counts_total[index] += len(values)
+
+    def iter_aggregates(
+        self,
+    ) -> Iterable[Tuple[LabelValues, LabelDict, "array[int]", float, int]]:
+        store = self._store
+        for index, key in enumerate(store.keys):
+            yield (
+                key,
+                store.label_records[index],
+                self._bucket_columns[index],
+                self._sums[index],
+                self._counts_total[index],
+            )
 
 
 class MetricsRegistry:
     """Collect guardrail, critic and latency metrics in-memory."""
 
+    # Pending counter increments per thread before a merge into the metric.
+    _FLUSH_EVERY = 256
+
     def __init__(self, now: Callable[[], datetime] | None = None) -> None:
         self._now = now or (lambda: datetime.now(timezone.utc))
         self.guardrail_verdicts = CounterMetric(
@@ -96,152 +478,267 @@ class MetricsRegistry:
             description="Distribution of end-to-end latency in milliseconds",
             label_names=("stage",),
         )
+        # Pre-bound label handles keyed by the single label value; recording
+        # through a handle skips per-call label validation and key building,
+        # so the hot verdict path is one dict probe plus an indexed write.
+        self._verdict_handles: Dict[str, _BoundCounter] = {}
+        self._scenario_handles: Dict[str, _BoundGauge] = {}
+        self._stage_handles: Dict[str, _BoundHistogram] = {}
+        # Timestamp pinned by scrape(); exports inside the block share it.
+        self._scrape_ts: str | None = None
+        # Counter increments buffer per thread and merge under one lock, so
+        # concurrent recorders do not contend (or race) on the shared
+        # columns.  Gauge and histogram writes stay direct: latest-wins and
+        # single indexed updates respectively.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._verdict_buffers: List[List[Tuple[str, float]]] = []
+        # Reusable exposition buffer backing as_openmetrics_bytes(); it
+        # keeps its capacity across scrapes.
+        self._scrape_buf = bytearray()
 
     # Recording helpers -------------------------------------------------
     def record_guardrail_verdict(self, verdict: str, weight: float = 1.0) -> None:
-        self.guardrail_verdicts.inc(weight, verdict=verdict)
+        buf = getattr(self._local, "verdicts", None)
+        if buf is None:
+            buf = self._local.verdicts = []
+            with self._lock:
+                self._verdict_buffers.append(buf)
+        buf.append((verdict, weight))
+        if len(buf) >= self._FLUSH_EVERY:
+            self._drain_verdicts(buf)
+
+    def _drain_verdicts(self, buf: List[Tuple[str, float]]) -> None:
+        # Snapshot-then-trim: list appends are atomic under the GIL and
+        # land at the tail, so deleting the snapshot prefix can neither
+        # drop nor double-count a concurrent increment.
+        with self._lock:
+            pending = buf[:]
+            del buf[: len(pending)]
+            handles = self._verdict_handles
+            for verdict, weight in pending:
+                handle = handles.get(verdict)
+                if handle is None:
+                    handle = self.guardrail_verdicts.labels(verdict)
+                    handles[verdict] = handle
+                handle.inc(weight)
+
+    def _flush_verdicts(self) -> None:
+        """Merge every thread's pending increments before an export."""
+
+        for buf in list(self._verdict_buffers):
+            if buf:
+                self._drain_verdicts(buf)
 
     def record_llm_critic_score(self, scenario: str, score: float) -> None:
-        self.llm_critic_score.set(score, scenario=scenario)
+        handle = self._scenario_handles.get(scenario)
+        if handle is None:
+            handle = self.llm_critic_score.labels(scenario)
+            self._scenario_handles[scenario] = handle
+        handle.set(score)
 
     def observe_latency(self, latency_ms: float, stage: str = "overall") -> None:
-        self.system_latency_ms.observe(latency_ms, stage=stage)
+        handle = self._stage_handles.get(stage)
+        if handle is None:
+            handle = self.system_latency_ms.labels(stage)
+            self._stage_handles[stage] = handle
+        handle.observe(latency_ms)
 
     # Export helpers ----------------------------------------------------
-    def as_prometheus(self) -> str:
-        lines: List[str] = []
-        # Counters
-        lines.extend(self._prometheus_counter(self.guardrail_verdicts))
-        # Gauges
-        lines.extend(self._prometheus_gauge(self.llm_critic_score))
-        # Histograms
-        lines.extend(self._prometheus_histogram(self.system_latency_ms))
-        return "\n".join(lines) + "\n"
-
-    def as_clickhouse_rows(self) -> List[Dict[str, object]]:
+    @contextmanager
+    def scrape(self):
+        """Pin one timestamp for every export made inside the block.
+
+        When the registry is scraped by several exporters back-to-back,
+        this resolves the clock once and stamps all of their rows with the
+        same instant instead of re-reading the clock per export.
+        """
+
         timestamp = self._now().isoformat()
-        rows: List[Dict[str, object]] = []
+        self._scrape_ts = timestamp
+        try:
+            yield timestamp
+        finally:
+            self._scrape_ts = None
+
+    def _write_exposition(self, buf: bytearray) -> None:
+        self._flush_verdicts()
+        self._write_counter(buf, self.guardrail_verdicts)
+        self._write_gauge(buf, self.llm_critic_score)
+        self._write_histogram(buf, self.system_latency_ms)
+
+    def as_prometheus_bytes(self) -> bytes:
+        """Serialise all metrics into one bytes buffer.
+
+        HTTP scrape handlers can send this directly; the per-line string
+        churn of the old list-of-lines build is replaced by appends of
+        pre-encoded fragments into a single bytearray.
+        """
+
+        buf = bytearray()
+        self._write_exposition(buf)
+        return bytes(buf)
+
+    def as_openmetrics_bytes(self) -> memoryview:
+        """Zero-copy exposition into the registry's reusable buffer.
+
+        Returns a memoryview over a bytearray owned by the registry, so a
+        scrape handler can hand it straight to ``sock.send()`` without the
+        final copy :meth:`as_prometheus_bytes` makes.  The view borrows
+        the buffer: release it before the next scrape, or that scrape
+        falls back to a fresh buffer.
+        """
+
+        buf = self._scrape_buf
+        try:
+            del buf[:]
+        except BufferError:
+            # A previous view is still alive; leave its buffer be and
+            # start over rather than fail the scrape.
+            buf = self._scrape_buf = bytearray()
+        self._write_exposition(buf)
+        return memoryview(buf)
+
+    def as_prometheus(self) -> str:
+        return self.as_prometheus_bytes().decode()
+
+    # Column order of the tuples produced by :meth:`as_clickhouse_tuples`;
+    # suitable for the driver's ``insert(rows, column_names=...)`` path.
+    _ch_columns = ("metric", "value", "type", "labels", "timestamp")
+
+    def as_clickhouse_tuples(
+        self,
+    ) -> List[Tuple[str, float, str, Mapping[str, str], str]]:
+        """Export all metrics as ClickHouse insert tuples.
 
-        for key, value in self.guardrail_verdicts.values.items():
-            labels = self.guardrail_verdicts.label_cache[key]
+        Tuples follow the :attr:`_ch_columns` order and share the metrics'
+        cached label records, so a scrape builds no per-row dicts apart
+        from the bucket rows (which need a private dict for ``le``).
+        """
+
+        self._flush_verdicts()
+        timestamp = self._scrape_ts or self._now().isoformat()
+        rows: List[Tuple[str, float, str, Mapping[str, str], str]] = []
+
+        counter_store = self.guardrail_verdicts._store
+        for index, labels in enumerate(counter_store.label_records):
             rows.append(
-                {
-                    "metric": self.guardrail_verdicts.name,
-                    "value": value,
-                    "type": "counter",
-                    "labels": dict(labels),
-                    "timestamp": timestamp,
-                }
+                (
+                    self.guardrail_verdicts.name,
+                    # Rows historically carried floats; normalise in case
+                    # the counter column is still int64.
+                    float(counter_store.values[index]),
+                    "counter",
+                    labels,
+                    timestamp,
+                )
             )
 
-        for key, value in self.llm_critic_score.values.items():
-            labels = self.llm_critic_score.label_cache[key]
+        gauge_store = self.llm_critic_score._store
+        for index, labels in enumerate(gauge_store.label_records):
             rows.append(
-                {
-                    "metric": self.llm_critic_score.name,
-                    "value": value,
-                    "type": "gauge",
-                    "labels": dict(labels),
-                    "timestamp": timestamp,
-                }
+                (
+                    self.llm_critic_score.name,
+                    gauge_store.values[index],
+                    "gauge",
+                    labels,
+                    timestamp,
+                )
             )
 
-        for labels, values in self.system_latency_ms.iter_statistics():
-            total = sum(values)
-            count = len(values)
-            buckets = self._histogram_bucket_counts(values, self.system_latency_ms.buckets)
-            for bound, bucket_count in buckets.items():
-                bucket_labels = dict(labels)
-                bucket_labels["le"] = bound
+        histogram = self.system_latency_ms
+        bucket_name = f"{histogram.name}_bucket"
+        sum_name = f"{histogram.name}_sum"
+        count_name = f"{histogram.name}_count"
+        for key, labels, counts, total, count in histogram.iter_aggregates():
+            for bound, bucket_count in zip(histogram._bucket_strs, counts):
                 rows.append(
-                    {
-                        "metric": f"{self.system_latency_ms.name}_bucket",
-                        "value": bucket_count,
-                        "type": "histogram_bucket",
-                        "labels": bucket_labels,
-                        "timestamp": timestamp,
-                    }
+                    (
+                        bucket_name,
+                        bucket_count,
+                        "histogram_bucket",
+                        {**labels, "le": bound},
+                        timestamp,
+                    )
                 )
-            rows.append(
-                {
-                    "metric": f"{self.system_latency_ms.name}_sum",
-                    "value": total,
-                    "type": "histogram_sum",
-                    "labels": dict(labels),
-                    "timestamp": timestamp,
-                }
-            )
-            rows.append(
-                {
-                    "metric": f"{self.system_latency_ms.name}_count",
-                    "value": count,
-                    "type": "histogram_count",
-                    "labels": dict(labels),
-                    "timestamp": timestamp,
-                }
-            )
+            rows.append((sum_name, total, "histogram_sum", labels, timestamp))
+            rows.append((count_name, count, "histogram_count", labels, timestamp))
+        return rows
+
+    def as_clickhouse_rows(self, *, copy_labels: bool = False) -> List[Dict[str, object]]:
+        """Export all metrics as ClickHouse insert rows (dicts).
+
+        Thin wrapper over :meth:`as_clickhouse_tuples` for callers that
+        want keyed rows.  By default rows share the metrics' cached label
+        dicts and must be treated as read-only; pass ``copy_labels=True``
+        to get private copies (the historical behaviour) at the cost of
+        one dict per row.
+        """
+
+        columns = self._ch_columns
+        rows: List[Dict[str, object]] = []
+        for row in self.as_clickhouse_tuples():
+            record = dict(zip(columns, row))
+            if copy_labels:
+                record["labels"] = dict(record["labels"])
+            rows.append(record)
         return rows
 
     # Internal helpers --------------------------------------------------
-    def _prometheus_counter(self, metric: CounterMetric) -> List[str]:
-        lines = [f"# HELP {metric.name} {metric.description}", f"# TYPE {metric.name} counter"]
-        for key, value in sorted(metric.values.items()):
-            labels = metric.label_cache[key]
-            label_str = self._format_labels(labels)
-            lines.append(f"{metric.name}{label_str} {value}")
-        return lines
-
-    def _prometheus_gauge(self, metric: GaugeMetric) -> List[str]:
-        lines = [f"# HELP {metric.name} {metric.description}", f"# TYPE {metric.name} gauge"]
-        for key, value in sorted(metric.values.items()):
-            labels = metric.label_cache[key]
-            label_str = self._format_labels(labels)
-            lines.append(f"{metric.name}{label_str} {value}")
-        return lines
-
-    def _prometheus_histogram(self, metric: HistogramMetric) -> List[str]:
-        lines = [f"# HELP {metric.name} {metric.description}", f"# TYPE {metric.name} histogram"]
-        for labels, values in metric.iter_statistics():
-            buckets = metric.buckets
-            counts = self._histogram_bucket_counts(values, buckets)
-            base_label = self._format_labels(labels)
-            cumulative = 0
-            for bound in buckets:
-                cumulative += counts[str(bound)]
-                label_map = dict(labels)
-                label_map["le"] = str(bound)
-                label_str = self._format_labels(label_map)
-                lines.append(f"{metric.name}_bucket{label_str} {cumulative}")
-            cumulative += counts["+Inf"]
-            inf_labels = dict(labels)
-            inf_labels["le"] = "+Inf"
-            lines.append(
-                f"{metric.name}_bucket{self._format_labels(inf_labels)} {cumulative}"
+    @staticmethod
+    def _write_samples(buf: bytearray, metric: _MetricBase) -> None:
+        buf += metric._header_bytes
+        store = metric._store
+        keys = store.keys
+        order = metric._sorted_keys
+        if order is None:
+            order = metric._sorted_keys = sorted(
+                range(len(keys)), key=keys.__getitem__
             )
-            lines.append(f"{metric.name}_sum{base_label} {sum(values)}")
-            lines.append(f"{metric.name}_count{base_label} {len(values)}")
-        return lines
+        name = metric._name_bytes
+        values = store.values
+        for index in order:
+            buf += name
+            buf += metric._label_bytes(keys[index])
+            buf += b" "
+            # float() normalises int64 counter columns to the float form
+            # Prometheus text exposition uses (2 -> "2.0").
+            buf += str(float(values[index])).encode()
+            buf += b"\n"
+
+    def _write_counter(self, buf: bytearray, metric: CounterMetric) -> None:
+        self._write_samples(buf, metric)
+
+    def _write_gauge(self, buf: bytearray, metric: GaugeMetric) -> None:
+        self._write_samples(buf, metric)
 
     @staticmethod
-    def _histogram_bucket_counts(values: Iterable[float], buckets: Tuple[float, ...]) -> Dict[str, int]:
-        counts = {str(bound): 0 for bound in buckets}
-        counts["+Inf"] = 0
-        for value in values:
-            placed = False
-            for bound in buckets:
-                if value <= bound:
-                    counts[str(bound)] += 1
-                    placed = True
-                    break
-            if not placed:
-                counts["+Inf"] += 1
-        return counts
+    def _write_histogram(buf: bytearray, metric: HistogramMetric) -> None:
+        buf += metric._header_bytes
+        name = metric._name_bytes
+        for key, labels, counts, total, count in metric.iter_aggregates():
+            base_label = metric._label_bytes(key)
+            bucket_labels = metric._bucket_label_bytes(key)
+            for label_bytes, cumulative in zip(bucket_labels, accumulate(counts)):
+                buf += name
+                buf += b"_bucket"
+                buf += label_bytes
+                buf += b" "
+                buf += str(cumulative).encode()
+                buf += b"\n"
+            buf += name
+            buf += b"_sum"
+            buf += base_label
+            buf += b" "
+            buf += str(total).encode()
+            buf += b"\n"
+            buf += name
+            buf += b"_count"
+            buf += base_label
+            buf += b" "
+            buf += str(count).encode()
+            buf += b"\n"
 
     @staticmethod
     def _format_labels(labels: Mapping[str, str]) -> str:
-        if not labels:
-            return ""
-        formatted = ",".join(
-            f"{key}=\"{value}\"" for key, value in sorted(labels.items())
-        )
-        return f"{{{formatted}}}"
+        return _format_labels(labels)
@@ -0,0 +1,303 @@
+"""Shared utility helpers used across op-observe services."""
+
+from __future__ import annotations
+
+from math import sqrt
+from typing import Any, Dict, Hashable, Iterator, List, Sequence, Tuple
+
+try:  # pragma: no cover - exercised only when numpy is installed
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
+
+
+Vector = Sequence[float]
+
+
+# Vector math ----------------------------------------------------------------
+def dot_product(a: Vector, b: Vector) -> float:
+    """Dot product of two equal-length vectors.
+
+    With numpy installed the reduction runs in BLAS; otherwise it falls
+    back to a Python loop.
+    """
+
+    if len(a) != len(b):
+        raise ValueError(f"vector lengths differ: {len(a)} != {len(b)}")
+    if _np is not None:
+        return float(
+            _np.dot(
+                _np.asarray(a, dtype=_np.float32),
+                _np.asarray(b, dtype=_np.float32),
+            )
+        )
+    return float(sum(x * y for x, y in zip(a, b)))
+
+
+def l2_norm(a: Vector) -> float:
+    """Euclidean norm of a vector."""
+
+    if _np is not None:
+        return float(_np.linalg.norm(_np.asarray(a, dtype=_np.float32)))
+    return sqrt(sum(x * x for x in a))
+
+
+def cosine_similarity(a: Vector, b: Vector) -> float:
+    """Cosine similarity of two equal-length vectors.
+
+    Returns 0.0 when either vector has zero magnitude.
+    """
+
+    if len(a) != len(b):
+        raise ValueError(f"vector lengths differ: {len(a)} != {len(b)}")
+    if _np is not None:
+        a_arr = _np.asarray(a, dtype=_np.float32)
+        b_arr = _np.asarray(b, dtype=_np.float32)
+        norm_a = float(_np.linalg.norm(a_arr))
+        norm_b = float(_np.linalg.norm(b_arr))
+        if norm_a == 0.0 or norm_b == 0.0:
+            return 0.0
+        return float(_np.dot(a_arr, b_arr)) / (norm_a * norm_b)
+    norm_a = l2_norm(a)
+    norm_b = l2_norm(b)
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot_product(a, b) / (norm_a * norm_b)
+
+
+def l2_distance(a: Vector, b: Vector) -> float:
+    """Euclidean distance between two equal-length vectors."""
+
+    if len(a) != len(b):
+        raise ValueError(f"vector lengths differ: {len(a)} != {len(b)}")
+    if _np is not None:
+        return float(
+            _np.linalg.norm(
+                _np.asarray(a, dtype=_np.float32)
+                - _np.asarray(b, dtype=_np.float32)
+            )
+        )
+    return sqrt(sum((x - y) * (x - y) for x, y in zip(a, b)))
+
+
+def dot_products_batch(vectors: Sequence[Vector], query: Vector) -> List[float]:
+    """Dot products of many vectors against one query.
+
+    With numpy this is a single matrix-vector product; the fallback loops
+    per vector.
+    """
+
+    if _np is not None:
+        matrix = _np.asarray(vectors, dtype=_np.float32)
+        return [
+            float(value)
+            for value in matrix @ _np.asarray(query, dtype=_np.float32)
+        ]
+    return [dot_product(vector, query) for vector in vectors]
+
+
+class VectorStore:
+    """Contiguous float32 store for one-query-against-many similarity.
+
+    Vectors live row-wise in a single (capacity, dim) buffer grown
+    geometrically, with per-vector norms precomputed on insert, so
+    :meth:`cosine_many` is one matrix-vector product plus an elementwise
+    divide.  Without numpy the store keeps plain tuples and loops.
+    """
+
+    def __init__(self, dim: int, capacity: int = 16) -> None:
+        self.dim = dim
+        if _np is not None:
+            self._data = _np.empty((max(capacity, 1), dim), dtype=_np.float32)
+            self._norms = _np.empty(max(capacity, 1), dtype=_np.float32)
+        else:
+            self._vectors: List[tuple] = []
+            self._norm_list: List[float] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, vector: Vector) -> None:
+        if len(vector) != self.dim:
+            raise ValueError(f"vector length {len(vector)} != dim {self.dim}")
+        if _np is not None:
+            if self._size == self._data.shape[0]:
+                grown = _np.empty(
+                    (self._data.shape[0] * 2, self.dim), dtype=_np.float32
+                )
+                grown[: self._size] = self._data[: self._size]
+                self._data = grown
+                grown_norms = _np.empty(
+                    self._norms.shape[0] * 2, dtype=_np.float32
+                )
+                grown_norms[: self._size] = self._norms[: self._size]
+                self._norms = grown_norms
+            row = _np.asarray(vector, dtype=_np.float32)
+            self._data[self._size] = row
+            self._norms[self._size] = _np.linalg.norm(row)
+        else:
+            self._vectors.append(tuple(float(value) for value in vector))
+            self._norm_list.append(l2_norm(vector))
+        self._size += 1
+
+    def cosine_many(self, query: Vector) -> List[float]:
+        """Cosine similarity of ``query`` against every stored vector."""
+
+        if len(query) != self.dim:
+            raise ValueError(f"query length {len(query)} != dim {self.dim}")
+        if _np is not None:
+            q = _np.asarray(query, dtype=_np.float32)
+            q_norm = float(_np.linalg.norm(q))
+            size = self._size
+            scores = (self._data[:size] @ q) / (
+                self._norms[:size] * q_norm + 1e-12
+            )
+            return [float(score) for score in scores]
+        q_norm = l2_norm(query)
+        return [
+            dot_product(vector, query) / (norm * q_norm + 1e-12)
+            for vector, norm in zip(self._vectors, self._norm_list)
+        ]
+
+
+class Int8VectorStore:
+    """Int8-quantised variant of :class:`VectorStore`.
+
+    Each vector is stored as int8 codes plus one float scale
+    (``max_abs / 127``), cutting bandwidth 4x versus float32; similarity
+    dequantises through the per-vector and per-query scales.
+    """
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+        self._codes: List[Any] = []
+        self._scales: List[float] = []
+        self._norms: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @staticmethod
+    def _quantise(vector: Vector) -> tuple:
+        max_abs = max((abs(float(value)) for value in vector), default=0.0)
+        scale = max_abs / 127.0 if max_abs else 1.0
+        if _np is not None:
+            codes = _np.round(
+                _np.asarray(vector, dtype=_np.float32) / scale
+            ).astype(_np.int8)
+        else:
+            codes = tuple(round(float(value) / scale) for value in vector)
+        return codes, scale
+
+    def add(self, vector: Vector) -> None:
+        if len(vector) != self.dim:
+            raise ValueError(f"vector length {len(vector)} != dim {self.dim}")
+        codes, scale = self._quantise(vector)
+        self._codes.append(codes)
+        self._scales.append(scale)
+        self._norms.append(l2_norm(vector))
+
+    def cosine_many(self, query: Vector) -> List[float]:
+        """Approximate cosine similarity of ``query`` against the store."""
+
+        if len(query) != self.dim:
+            raise ValueError(f"query length {len(query)} != dim {self.dim}")
+        q_codes, q_scale = self._quantise(query)
+        q_norm = l2_norm(query)
+        scores: List[float] = []
+        if _np is not None:
+            q16 = q_codes.astype(_np.int32)
+            for codes, scale, norm in zip(self._codes, self._scales, self._norms):
+                # Integer dot with 32-bit accumulation, then one dequantise.
+                dot = int(codes.astype(_np.int32) @ q16) * (scale * q_scale)
+                scores.append(dot / (norm * q_norm + 1e-12))
+            return scores
+        for codes, scale, norm in zip(self._codes, self._scales, self._norms):
+            dot = sum(x * y for x, y in zip(codes, q_codes)) * (scale * q_scale)
+            scores.append(dot / (norm * q_norm + 1e-12))
+        return scores
+
+
+class _Node:
+    """Entry in the LRU chain; links are intrusive to avoid indirection."""
+
+    __slots__ = ("key", "value", "prev", "nxt")
+
+    def __init__(self, key: Hashable = None, value: Any = None) -> None:
+        self.key = key
+        self.value = value
+        self.prev: "_Node" = self
+        self.nxt: "_Node" = self
+
+
+class LRUCache:
+    """Bounded mapping with least-recently-used eviction.
+
+    Hits move the entry to the most-recently-used position; inserts beyond
+    ``maxsize`` evict the least-recently-used entry.  Long-lived services use
+    this in place of bare dict caches so memoisation cannot grow without
+    bound.
+
+    Internally a dict maps keys to nodes of a circular doubly linked list
+    anchored by a sentinel (most-recent after the sentinel, least-recent
+    before it), so promoting a hit is a few pointer swaps — one hash probe
+    and no rehash, the same representation ``functools.lru_cache`` uses.
+    """
+
+    __slots__ = ("maxsize", "_map", "_head")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._map: Dict[Hashable, _Node] = {}
+        self._head = _Node()
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._map
+
+    def _move_to_front(self, node: _Node) -> None:
+        node.prev.nxt = node.nxt
+        node.nxt.prev = node.prev
+        head = self._head
+        node.prev = head
+        node.nxt = head.nxt
+        head.nxt.prev = node
+        head.nxt = node
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        node = self._map.get(key)
+        if node is None:
+            return default
+        self._move_to_front(node)
+        return node.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            self._move_to_front(node)
+            return
+        node = _Node(key, value)
+        self._map[key] = node
+        head = self._head
+        node.prev = head
+        node.nxt = head.nxt
+        head.nxt.prev = node
+        head.nxt = node
+        if len(self._map) > self.maxsize:
+            lru = head.prev
+            lru.prev.nxt = head
+            head.prev = lru.prev
+            del self._map[lru.key]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate entries from least- to most-recently used."""
+
+        head = self._head
+        node = head.prev
+        while node is not head:
+            yield node.key, node.value
+            node = node.prev
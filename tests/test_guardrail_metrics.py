@@ -0,0 +1,64 @@
+from op_observe.telemetry import (
+    GuardrailDirection,
+    GuardrailMetrics,
+    GuardrailSeverity,
+)
+from op_observe.telemetry.guardrails import MemoryHistogram
+
+
+def test_guard_failures_accumulate_per_direction_and_severity():
+    metrics = GuardrailMetrics()
+    metrics.record_guard_failure(GuardrailDirection.INPUT, GuardrailSeverity.WARNING)
+    metrics.record_guard_failure(GuardrailDirection.INPUT, GuardrailSeverity.WARNING)
+    metrics.record_guard_failure(GuardrailDirection.OUTPUT, GuardrailSeverity.CRITICAL)
+
+    totals = metrics.guard_failure_totals()
+    assert totals[(GuardrailDirection.INPUT, GuardrailSeverity.WARNING)] == 2
+    assert totals[(GuardrailDirection.OUTPUT, GuardrailSeverity.CRITICAL)] == 1
+
+
+def test_critic_scores_stream_into_cumulative_buckets():
+    metrics = GuardrailMetrics()
+    metrics.record_critic_score(0.2, verdict="fail")
+    metrics.record_critic_score(0.8, verdict="pass")
+    metrics.record_critic_score(0.95, verdict="pass")
+
+    summary = metrics.critic_score_summary()
+    assert summary["count"] == 3
+    assert summary["sum"] == 0.2 + 0.8 + 0.95
+    buckets = summary["buckets"]
+    assert buckets[0.25] == 1
+    assert buckets[0.9] == 2
+    assert buckets[float("inf")] == 3
+
+
+def test_histogram_collects_streamed_aggregates():
+    # Exercise the in-memory collector directly: which backend a full
+    # GuardrailMetrics binds depends on the installed SDKs.
+    histogram = MemoryHistogram(
+        "critic_score", "scores", ("verdict",), (0.5, float("inf"))
+    )
+    histogram.labels("pass").observe(0.3)
+    histogram.labels("pass").observe(0.7)
+
+    state = histogram.collect_values()[("pass",)]
+    assert state["count"] == 2
+    assert state["sum"] == 1.0
+    assert state["buckets"][0.5] == 1
+    assert state["buckets"][float("inf")] == 2
+
+
+def test_batched_critic_scores_match_streaming():
+    streamed = GuardrailMetrics()
+    batched = GuardrailMetrics()
+    scores = [0.2, 0.8, 0.95, 0.5]
+    for score in scores:
+        streamed.record_critic_score(score, verdict="pass")
+    batched.record_critic_scores(scores, verdict="pass")
+
+    assert batched.critic_score_summary() == streamed.critic_score_summary()
+
+
+def test_custom_buckets_are_normalised_with_inf():
+    metrics = GuardrailMetrics(buckets=(0.5, 0.1, 0.5))
+    assert metrics._bucket_boundaries == (0.1, 0.5, float("inf"))
@@ -78,3 +78,22 @@ def test_no_baseline_files_modified():
         # Touching files would alter mtime; ensure file is not empty as a proxy for accidental edits.
         assert mtime > 0
         assert file_path.stat().st_size >= 0
+
+
+def test_unified_config_merges_resource_attributes_once():
+    from op_observe.telemetry import UnifiedTelemetryConfig
+
+    config = UnifiedTelemetryConfig(
+        service_name="op-observe",
+        environment="staging",
+        resource_attributes={"team": "observability"},
+    )
+    attrs = config.resource_attributes_for("retrieval")
+    assert attrs == {
+        "service.name": "op-observe",
+        "deployment.environment": "staging",
+        "team": "observability",
+        "opobserve.module": "retrieval",
+    }
+    # Per-module copies never leak back into the shared base mapping.
+    assert "opobserve.module" not in config.resource_attributes_for()
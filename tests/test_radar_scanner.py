@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from op_observe.agentic_security import scan_repository
+from op_observe.agentic_security.radar import RepositoryScanner
+
+
+LANGGRAPH_SOURCE = '''
+from langgraph.graph import StateGraph
+from langchain.tools import tool
+
+workflow = StateGraph("support-flow")
+workflow.add_node("triage")
+workflow.add_node("respond")
+workflow.add_edge("triage", "respond")
+
+MCP_ENDPOINT = "mcp://tools.internal:8080"
+
+
+@tool
+def lookup_order(order_id: str) -> str:
+    """Fetch an order from the database."""
+    return order_id
+'''
+
+N8N_WORKFLOW = {
+    "nodes": [
+        {"name": "Webhook", "type": "n8n-nodes-base.webhook"},
+        {"name": "Summarize", "type": "n8n-nodes-langchain.agent"},
+    ],
+    "connections": {
+        "Webhook": {"main": [[{"node": "Summarize"}]]},
+    },
+}
+
+CONFIG_YAML = """
+agents:
+  - name: billing-agent
+tools:
+  - name: invoice-search
+mcp_servers:
+  billing-mcp:
+    command: uvx
+"""
+
+
+@pytest.fixture()
+def sample_repo(tmp_path: Path) -> Path:
+    (tmp_path / "app.py").write_text(LANGGRAPH_SOURCE, encoding="utf-8")
+    (tmp_path / "flow.json").write_text(json.dumps(N8N_WORKFLOW), encoding="utf-8")
+    (tmp_path / "agents.yaml").write_text(CONFIG_YAML, encoding="utf-8")
+    return tmp_path
+
+
+def test_scan_extracts_python_workflow(sample_repo: Path) -> None:
+    graph = scan_repository(sample_repo)
+    result = graph.as_dict()
+
+    nodes = {node["id"]: node for node in result["nodes"]}
+    assert nodes["support-flow"]["kind"] == "workflow"
+    assert nodes["triage"]["kind"] == "step"
+    assert nodes["lookup_order"]["kind"] == "tool"
+
+    edges = {(edge["source"], edge["target"]) for edge in result["edges"]}
+    assert ("triage", "respond") in edges
+
+
+def test_scan_extracts_n8n_and_config_entries(sample_repo: Path) -> None:
+    graph = scan_repository(sample_repo)
+    result = graph.as_dict()
+
+    nodes = {node["id"]: node for node in result["nodes"]}
+    assert nodes["Summarize"]["kind"] == "agent"
+    assert nodes["Webhook"]["kind"] == "trigger"
+    assert nodes["billing-agent"]["kind"] == "agent"
+    assert nodes["invoice-search"]["kind"] == "tool"
+
+    servers = {server["name"] for server in result["mcp_servers"]}
+    assert "mcp://tools.internal:8080" in servers
+    assert "billing-mcp" in servers
+
+
+def test_scan_cache_round_trip(sample_repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OP_OBSERVE_CACHE", "1")
+
+    first = RepositoryScanner(sample_repo).scan().as_dict()
+    cache_file = sample_repo / ".op-observe-cache" / "radar-cache.json"
+    assert cache_file.is_file()
+
+    # Second scan is served from the per-file cache and must be identical.
+    second = RepositoryScanner(sample_repo).scan().as_dict()
+    assert first == second
+
+
+def test_cache_invalidated_on_modification(
+    sample_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OP_OBSERVE_CACHE", "1")
+    RepositoryScanner(sample_repo).scan()
+
+    config = sample_repo / "agents.yaml"
+    config.write_text(
+        CONFIG_YAML.replace("- name: billing-agent", "- name: billing-agent\n  - name: refund-agent"),
+        encoding="utf-8",
+    )
+
+    graph = RepositoryScanner(sample_repo).scan()
+    assert "refund-agent" in graph.nodes
@@ -0,0 +1,124 @@
+from op_observe.retrieval import (
+    Document,
+    HnswIndex,
+    HTTPSession,
+    InMemoryRetriever,
+    LocalQdrantClient,
+    QdrantVectorStore,
+)
+
+
+def _build_index():
+    index = HnswIndex(dim=3, m=4, ef_search=8)
+    index.add_point("x-axis", (1.0, 0.0, 0.0))
+    index.add_point("y-axis", (0.0, 1.0, 0.0))
+    index.add_point("z-axis", (0.0, 0.0, 1.0))
+    index.add_point("diagonal", (1.0, 1.0, 0.0))
+    return index
+
+
+def test_search_returns_nearest_first():
+    index = _build_index()
+    results = index.search((0.9, 0.1, 0.0), top_k=2)
+    assert [point_id for point_id, _ in results] == ["x-axis", "diagonal"]
+    assert results[0][1] > results[1][1]
+
+
+def test_search_scores_are_cosine_of_normalised_vectors():
+    index = _build_index()
+    ((point_id, score),) = index.search((2.0, 0.0, 0.0), top_k=1)
+    assert point_id == "x-axis"
+    assert abs(score - 1.0) < 1e-6
+
+
+def test_update_point_moves_the_vector():
+    index = _build_index()
+    index.update_point("diagonal", (0.0, 0.0, 1.0))
+    results = index.search((0.0, 0.0, 1.0), top_k=2)
+    assert {point_id for point_id, _ in results} == {"z-axis", "diagonal"}
+
+
+def test_empty_index_returns_no_results():
+    index = HnswIndex(dim=3)
+    assert index.search((1.0, 0.0, 0.0)) == []
+    assert len(index) == 0
+
+
+def test_int8_index_matches_float_ranking():
+    index = HnswIndex(dim=3, m=4, ef_search=8, dtype="i8")
+    index.add_point("x-axis", (1.0, 0.0, 0.0))
+    index.add_point("y-axis", (0.0, 1.0, 0.0))
+    index.add_point("diagonal", (1.0, 1.0, 0.0))
+    results = index.search((0.9, 0.1, 0.0), top_k=2)
+    assert [point_id for point_id, _ in results] == ["x-axis", "diagonal"]
+    assert abs(results[0][1] - 0.9938) < 0.01
+
+
+def test_retriever_ranks_by_token_overlap():
+    retriever = InMemoryRetriever(
+        [
+            Document("a", "alerts fire when latency spikes"),
+            Document("b", "guardrail verdicts gate deploys"),
+            Document("c", "latency dashboards track noisy spikes closely all week"),
+        ]
+    )
+    results = retriever.retrieve("latency spikes", top_k=2)
+    assert [document.doc_id for document, _ in results] == ["a", "c"]
+    assert results[0][1] > results[1][1]
+
+
+def test_retriever_skips_documents_without_shared_tokens():
+    retriever = InMemoryRetriever([Document("a", "one two three")])
+    assert retriever.retrieve("four five") == []
+    assert retriever.retrieve("") == []
+
+
+def test_http_session_merges_params_and_headers():
+    session = HTTPSession(headers={"Authorization": "Bearer t"})
+    url = session._apply_params("https://host/a?x=1", {"y": 2})
+    assert url == "https://host/a?x=1&y=2"
+    assert session._apply_params("https://host/a", {"y": 2}) == "https://host/a?y=2"
+    merged = session._merged_headers({"X-Extra": "1"}, has_body=True)
+    assert merged == {
+        "Authorization": "Bearer t",
+        "X-Extra": "1",
+        "Content-Type": "application/json",
+    }
+
+
+def test_http_session_pools_connections_per_endpoint():
+    session = HTTPSession()
+    first = session._connection("http", "localhost", 8080)
+    assert session._connection("http", "localhost", 8080) is first
+    assert session._connection("http", "localhost", 9090) is not first
+    session.close()
+    assert session._connections == {}
+
+
+def test_qdrant_store_returns_readonly_views():
+    import pytest
+
+    client = LocalQdrantClient(dim=3, m=4, ef_search=8)
+    store = QdrantVectorStore(client)
+    store.upsert_documents(
+        [
+            Document("a", "alpha", {"lang": "en"}),
+            Document("b", "beta"),
+        ],
+        [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0)],
+    )
+    (match, _) = store.search((1.0, 0.0, 0.0), top_k=2)
+    assert match.point_id == "a"
+    assert match.payload["text"] == "alpha"
+    assert match.payload["lang"] == "en"
+    with pytest.raises(TypeError):
+        match.payload["text"] = "mutated"
+    assert dict(match.payload)["text"] == "alpha"
+
+
+def test_compact_preserves_search_results():
+    index = _build_index()
+    before = index.search((0.9, 0.1, 0.0), top_k=3)
+    index.compact()
+    assert index.search((0.9, 0.1, 0.0), top_k=3) == before
+    assert index._row_to_id[0] == index._entrypoint
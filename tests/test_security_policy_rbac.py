@@ -13,6 +13,7 @@ from op_observe.security import (
     load_policy_bundle,
     load_rbac_config,
 )
+from op_observe.security.policy import Constraint, PolicyBundle
 
 
 @pytest.fixture(scope="module")
@@ -108,3 +109,27 @@ def test_rbac_enforcer_rejects_missing_permission(rbac_enforcer: RBACEnforcer) -
     )
     assert decision.allowed is False
     assert "not permitted" in " ".join(decision.messages)
+
+
+def test_constraint_name_cannot_inject_into_generated_source() -> None:
+    # Constraint names come from configuration; a newline in one must end
+    # up as an inert comment in the compiled evaluator, not as code.
+    hostile = Constraint(
+        name="x\n    v.append('INJECTED')  #",
+        kind="K8sAllowedRoles",
+        parameters={"allowedRoles": ("platform-admin",)},
+        match={"kinds": {"kinds": ("Secret",)}},
+    )
+    engine = PolicyEngine(PolicyBundle(templates=(), constraints=(hostile,)))
+    request = PolicyRequest(
+        resource_kind="Secret",
+        resource_name="vault:kv/app",
+        namespace="op-observe",
+        annotations={},
+        labels={},
+        roles=("platform-admin",),
+        action="read",
+    )
+    decision = engine.evaluate(request)
+    assert decision.allowed is True
+    assert decision.violations == ()